@@ -3,43 +3,69 @@
 Show current transits and moon phase for today.
 """
 
-import json
+from bisect import bisect_right
 from datetime import datetime, timezone
-import os
+from functools import lru_cache
+from operator import itemgetter
+from lib.position_store import load_day_positions
+from utils.formatters import load_json as load_json_file
+
+# Planets shown in the positions table, in display order, with their symbols
+DISPLAY_PLANETS = (
+    ('Sun', '☉'),
+    ('Moon', '☽'),
+    ('Mercury', '☿'),
+    ('Venus', '♀'),
+    ('Mars', '♂'),
+    ('Jupiter', '♃'),
+    ('Saturn', '♄'),
+    ('Uranus', '♅'),
+    ('Neptune', '♆'),
+    ('Pluto', '♇')
+)
+
+
+@lru_cache(maxsize=32)
+def load_json(filepath):
+    """Load JSON file (cached; callers must not mutate the result)."""
+    return load_json_file(filepath)
 
 
-def load_json(filepath):
-    """Load JSON file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+@lru_cache(maxsize=64)
+def load_month_positions(filepath):
+    """Load a monthly positions file indexed by date (cached; callers must not mutate the result)."""
+    data = load_json(filepath)
+    return {position['date']: position for position in data['positions']}
 
 
 def get_current_positions(date_str):
     """
     Get planetary positions for a specific date.
 
+    Reads the yearly binary position file when present, falling back to
+    the monthly JSON file otherwise.
+
     Args:
         date_str: Date in YYYY-MM-DD format
 
     Returns:
         Dictionary with planetary positions
     """
+    position = load_day_positions(date_str)
+    if position is not None:
+        return position
+
     year, month, day = date_str.split('-')
     month_str = f"{year}-{month}"
 
     filepath = f"../data/daily-positions/{month_str}.json"
 
-    if not os.path.exists(filepath):
+    try:
+        positions_by_date = load_month_positions(filepath)
+    except FileNotFoundError:
         return None
 
-    data = load_json(filepath)
-
-    # Find the specific date
-    for position in data['positions']:
-        if position['date'] == date_str:
-            return position
-
-    return None
+    return positions_by_date.get(date_str)
 
 
 def get_current_moon_phase(date_str):
@@ -55,28 +81,36 @@ def get_current_moon_phase(date_str):
     year = date_str.split('-')[0]
     filepath = f"../data/moon-phases/{year}.json"
 
-    if not os.path.exists(filepath):
+    try:
+        data = load_json(filepath)
+    except FileNotFoundError:
         return None
 
-    data = load_json(filepath)
-    target_date = datetime.fromisoformat(date_str + "T00:00:00Z")
-
-    # Find the most recent phase
-    recent_phase = None
-    next_phase = None
+    phases = data['phases']
 
-    for phase in data['phases']:
-        phase_date = datetime.fromisoformat(phase['date'].replace('Z', '+00:00'))
+    # Phase dates are uniform ISO 8601 UTC strings, so they sort
+    # chronologically as plain strings and can be bisected without parsing
+    target = date_str + "T00:00:00Z"
+    index = bisect_right(phases, target, key=itemgetter('date'))
 
-        if phase_date <= target_date:
-            recent_phase = phase
-        elif phase_date > target_date and next_phase is None:
-            next_phase = phase
-            break
+    recent_phase = phases[index - 1] if index > 0 else None
+    next_phase = phases[index] if index < len(phases) else None
 
     return recent_phase, next_phase
 
 
+def parse_utc_timestamp(timestamp):
+    """
+    Parse a "YYYY-MM-DDTHH:MM:SSZ" timestamp into a UTC datetime.
+
+    The generated data always uses this exact layout, so the fields are
+    sliced out directly instead of going through datetime.fromisoformat.
+    """
+    return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                    int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]),
+                    tzinfo=timezone.utc)
+
+
 def format_phase_name(phase):
     """Format phase name for display."""
     names = {
@@ -90,8 +124,8 @@ def format_phase_name(phase):
 
 def calculate_days_between(date1_str, date2_str):
     """Calculate days between two ISO date strings."""
-    d1 = datetime.fromisoformat(date1_str.replace('Z', '+00:00'))
-    d2 = datetime.fromisoformat(date2_str.replace('Z', '+00:00'))
+    d1 = parse_utc_timestamp(date1_str)
+    d2 = parse_utc_timestamp(date2_str)
     return abs((d2 - d1).days)
 
 
@@ -121,27 +155,16 @@ def main():
     print("=" * 70)
     print()
 
+    # Pull the displayed fields into parallel columns once
+    planets = positions['planets']
+    signs = tuple(planets[planet_name]['sign'] for planet_name, _ in DISPLAY_PLANETS)
+    degrees = tuple(planets[planet_name]['degree_in_sign'] for planet_name, _ in DISPLAY_PLANETS)
+    retrograde = tuple(planets[planet_name]['retrograde'] for planet_name, _ in DISPLAY_PLANETS)
+
     # Display planets in order
-    for planet_name in ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars',
-                        'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']:
-        planet = positions['planets'][planet_name]
-        rx = " ℞" if planet['retrograde'] else ""
-
-        # Add emoji for personal planets
-        emoji = {
-            'Sun': '☉',
-            'Moon': '☽',
-            'Mercury': '☿',
-            'Venus': '♀',
-            'Mars': '♂',
-            'Jupiter': '♃',
-            'Saturn': '♄',
-            'Uranus': '♅',
-            'Neptune': '♆',
-            'Pluto': '♇'
-        }.get(planet_name, '')
-
-        print(f"{emoji} {planet_name:10} {planet['sign']:12} {planet['degree_in_sign']:6.2f}°{rx}")
+    for (planet_name, emoji), sign, degree, rx_flag in zip(DISPLAY_PLANETS, signs, degrees, retrograde):
+        rx = " ℞" if rx_flag else ""
+        print(f"{emoji} {planet_name:10} {sign:12} {degree:6.2f}°{rx}")
 
     # Get moon phase
     recent_phase, next_phase = get_current_moon_phase(date_str)
@@ -152,7 +175,7 @@ def main():
         print("=" * 70)
         print()
 
-        phase_date = datetime.fromisoformat(recent_phase['date'].replace('Z', '+00:00'))
+        phase_date = parse_utc_timestamp(recent_phase['date'])
         days_since = (today - phase_date).days
 
         print(f"Most Recent: {format_phase_name(recent_phase['phase'])}")
@@ -161,7 +184,7 @@ def main():
         print(f"Moon was in: {recent_phase['moon_sign']} {recent_phase['moon_degree']:.2f}°")
 
         if next_phase:
-            next_date = datetime.fromisoformat(next_phase['date'].replace('Z', '+00:00'))
+            next_date = parse_utc_timestamp(next_phase['date'])
             days_until = (next_date - today).days
 
             print(f"\nNext Phase: {format_phase_name(next_phase['phase'])}")
@@ -195,9 +218,8 @@ def main():
 
     # Calculate approximate moon phase percentage
     if recent_phase and next_phase:
-        total_cycle = (datetime.fromisoformat(next_phase['date'].replace('Z', '+00:00')) -
-                      datetime.fromisoformat(recent_phase['date'].replace('Z', '+00:00'))).total_seconds()
-        elapsed = (today - datetime.fromisoformat(recent_phase['date'].replace('Z', '+00:00'))).total_seconds()
+        total_cycle = (next_date - phase_date).total_seconds()
+        elapsed = (today - phase_date).total_seconds()
 
         if total_cycle > 0:
             phase_progress = (elapsed / total_cycle) * 100
@@ -9,8 +9,12 @@ Usage:
 """
 
 import argparse
+import io
+import logging
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime, timezone
 
 # Add scripts directory to path for imports
@@ -25,6 +29,21 @@ from lib.eclipses import generate_year_eclipses
 from lib.curated_events import generate_curated_year
 from utils.formatters import save_json, format_datetime_iso
 
+# Progress output goes through one plain-message handler; multi-line banners
+# are emitted as a single record rather than one print per line
+logger = logging.getLogger('ephemeris')
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def section_banner(title: str) -> str:
+    """Format a section heading framed by rules of '='."""
+    return f"\n{'='*60}\n{title}\n{'='*60}"
+
 
 def generate_major_transits(year: int, output_dir: str = '../data/major-transits'):
     """
@@ -36,21 +55,11 @@ def generate_major_transits(year: int, output_dir: str = '../data/major-transits
     """
     import swisseph as swe
 
-    print(f"\n{'='*60}")
-    print(f"GENERATING MAJOR TRANSITS FOR {year}")
-    print(f"{'='*60}")
+    logger.info(section_banner(f"GENERATING MAJOR TRANSITS FOR {year}"))
 
-    # Generate aspects and ingresses
-    aspects = generate_year_aspects(year, output_dir)
-    ingresses = generate_year_ingresses(year, output_dir)
-
-    # Combine and sort by date
-    all_transits = aspects + ingresses
-    all_transits.sort(key=lambda x: x['julian_day'])
-
-    # Separate back into aspects and ingresses for output
-    aspects_output = [t for t in all_transits if t['type'] == 'aspect']
-    ingresses_output = [t for t in all_transits if t['type'] == 'ingress']
+    # Generate aspects and ingresses (each list is already sorted by date)
+    aspects_output = generate_year_aspects(year, output_dir)
+    ingresses_output = generate_year_ingresses(year, output_dir)
 
     # Create output structure
     output = {
@@ -64,76 +73,123 @@ def generate_major_transits(year: int, output_dir: str = '../data/major-transits
         'ingresses': ingresses_output
     }
 
-    # Save to file
+    # Save to file (json.dump encodes incrementally, so no full JSON string is built)
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, f"{year}.json")
     save_json(output, output_file)
 
-    print(f"\nCombined major transits saved to {output_file}")
-    print(f"  Total aspects: {len(aspects_output)}")
-    print(f"  Total ingresses: {len(ingresses_output)}")
+    logger.info(
+        f"\nCombined major transits saved to {output_file}\n"
+        f"  Total aspects: {len(aspects_output)}\n"
+        f"  Total ingresses: {len(ingresses_output)}"
+    )
+
+
+def generate_year_data(year: int):
+    """
+    Generate all per-year ephemeris data types for a single year.
+
+    Args:
+        year: Year to generate data for
+    """
+    logger.info(f"\n{'*'*60}\n* PROCESSING YEAR {year}\n{'*'*60}\n")
+
+    # 1. Daily Positions
+    logger.info(section_banner(f"GENERATING DAILY POSITIONS FOR {year}"))
+    generate_year_positions(year)
+
+    # 2. Moon Phases
+    logger.info(section_banner(f"GENERATING MOON PHASES FOR {year}"))
+    generate_year_moon_phases(year)
+
+    # 3. Major Transits (Aspects + Ingresses)
+    generate_major_transits(year)
+
+    # 4. Retrograde Periods
+    logger.info(section_banner(f"GENERATING RETROGRADE PERIODS FOR {year}"))
+    generate_year_retrogrades(year)
+
+    # 5. Eclipses
+    logger.info(section_banner(f"GENERATING ECLIPSES FOR {year}"))
+    generate_year_eclipses(year)
+
+    logger.info(f"\n{'*'*60}\n* COMPLETED YEAR {year}\n{'*'*60}\n")
 
 
-def generate_all_data(years: list[int]):
+def _generate_year_data_logged(year: int) -> str:
+    """
+    Generate a year in a worker process and return its progress output.
+
+    Both the library modules' prints and this script's log records are
+    captured, so the parent can print each year's output in year order.
+
+    Args:
+        year: Year to generate data for
+
+    Returns:
+        Everything generate_year_data printed or logged
+    """
+    buffer = io.StringIO()
+    handlers = [handler for handler in logger.handlers if isinstance(handler, logging.StreamHandler)]
+    previous_streams = [handler.setStream(buffer) for handler in handlers]
+    try:
+        with redirect_stdout(buffer):
+            generate_year_data(year)
+    finally:
+        for handler, stream in zip(handlers, previous_streams):
+            handler.setStream(stream)
+    return buffer.getvalue()
+
+
+def generate_all_data(years: list[int], workers: int | None = None, force: bool = False,
+                      compact: bool = False, output_format: str = 'json'):
     """
     Generate all ephemeris data types for specified years.
 
+    Years are independent of each other, so they are generated in parallel
+    worker processes (Swiss Ephemeris calls hold the GIL, so threads would
+    not help).
+
     Args:
         years: List of years to generate data for
+        workers: Number of worker processes (default: one per year, up to CPU count)
+        force: Regenerate curated files even if they are up to date
+        compact: Write the curated files as minified JSON
+        output_format: Curated file format, 'json' or 'jsonl'
     """
-    print(f"\n{'#'*60}")
-    print(f"# CELESTIAL TRANSIT DATA GENERATION")
-    print(f"# Years: {', '.join(map(str, years))}")
-    print(f"# Started: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    print(f"{'#'*60}\n")
+    if workers is None:
+        workers = min(len(years), os.cpu_count() or 1)
+
+    logger.info(
+        f"\n{'#'*60}\n"
+        f"# CELESTIAL TRANSIT DATA GENERATION\n"
+        f"# Years: {', '.join(map(str, years))}\n"
+        f"# Workers: {workers}\n"
+        f"# Started: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+        f"{'#'*60}\n"
+    )
 
-    for year in years:
-        print(f"\n{'*'*60}")
-        print(f"* PROCESSING YEAR {year}")
-        print(f"{'*'*60}\n")
-
-        # 1. Daily Positions
-        print(f"\n{'='*60}")
-        print(f"GENERATING DAILY POSITIONS FOR {year}")
-        print(f"{'='*60}")
-        generate_year_positions(year)
-
-        # 2. Moon Phases
-        print(f"\n{'='*60}")
-        print(f"GENERATING MOON PHASES FOR {year}")
-        print(f"{'='*60}")
-        generate_year_moon_phases(year)
-
-        # 3. Major Transits (Aspects + Ingresses)
-        generate_major_transits(year)
-
-        # 4. Retrograde Periods
-        print(f"\n{'='*60}")
-        print(f"GENERATING RETROGRADE PERIODS FOR {year}")
-        print(f"{'='*60}")
-        generate_year_retrogrades(year)
-
-        # 5. Eclipses
-        print(f"\n{'='*60}")
-        print(f"GENERATING ECLIPSES FOR {year}")
-        print(f"{'='*60}")
-        generate_year_eclipses(year)
-
-        print(f"\n{'*'*60}")
-        print(f"* COMPLETED YEAR {year}")
-        print(f"{'*'*60}\n")
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers buffer their output; map yields it in year order, and
+            # consuming it re-raises worker exceptions here
+            for log in executor.map(_generate_year_data_logged, years):
+                logger.info(log.removesuffix('\n'))
+    else:
+        for year in years:
+            generate_year_data(year)
 
     # After all years are generated, create curated files
-    print(f"\n{'='*60}")
-    print(f"GENERATING CURATED EVENT FILES")
-    print(f"{'='*60}")
+    logger.info(section_banner("GENERATING CURATED EVENT FILES"))
     for year in years:
-        generate_curated_year(year)
+        generate_curated_year(year, compact=compact, force=force, output_format=output_format)
 
-    print(f"\n{'#'*60}")
-    print(f"# GENERATION COMPLETE!")
-    print(f"# Finished: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    print(f"{'#'*60}\n")
+    logger.info(
+        f"\n{'#'*60}\n"
+        f"# GENERATION COMPLETE!\n"
+        f"# Finished: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+        f"{'#'*60}\n"
+    )
 
 
 def main():
@@ -178,6 +234,32 @@ Examples:
         help='Generate all data types (same as --type all)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for --type all (default: one per year, up to CPU count)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate curated files even if they are newer than their sources'
+    )
+
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write curated files as minified JSON'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=['json', 'jsonl'],
+        default='json',
+        help='Curated file format: one JSON document or one line per event (default: json)'
+    )
+
     args = parser.parse_args()
 
     # Normalize years to list
@@ -189,16 +271,14 @@ Examples:
     # Determine data type
     data_type = 'all' if args.all else args.type
 
-    print(f"\nConfiguration:")
-    print(f"  Years: {years}")
-    print(f"  Data type: {data_type}\n")
+    logger.info(f"\nConfiguration:\n  Years: {years}\n  Data type: {data_type}\n")
 
     try:
         if data_type == 'all':
-            generate_all_data(years)
+            generate_all_data(years, args.workers, args.force, args.compact, args.format)
         else:
             for year in years:
-                print(f"\nGenerating {data_type} for {year}...\n")
+                logger.info(f"\nGenerating {data_type} for {year}...\n")
 
                 if data_type == 'positions':
                     generate_year_positions(year)
@@ -211,12 +291,13 @@ Examples:
                 elif data_type == 'eclipses':
                     generate_year_eclipses(year)
                 elif data_type == 'curated':
-                    generate_curated_year(year)
+                    generate_curated_year(year, compact=args.compact, force=args.force,
+                                          output_format=args.format)
 
-        print("\n✓ Generation completed successfully!\n")
+        logger.info("\n✓ Generation completed successfully!\n")
 
     except Exception as e:
-        print(f"\n✗ Error during generation: {e}\n")
+        logger.error(f"\n✗ Error during generation: {e}\n")
         import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -2,18 +2,46 @@
 Calculate major aspects between outer planets.
 """
 
-import swisseph as swe
-from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Tuple
-from lib.config import PLANETS, SWEPH_FLAGS, ASPECTS, OUTER_PLANETS, INNER_PLANETS_FOR_CONJUNCTIONS
-from utils.formatters import get_zodiac_sign, format_datetime_iso, round_decimal
-from utils.julian_date import datetime_to_julian_day, julian_day_to_datetime
+from lib.config import (
+    PLANETS, ASPECTS, ASPECT_NAMES, ASPECT_ANGLES, ASPECT_ORBS, ASPECT_SYMBOLS,
+    OUTER_PLANETS, INNER_PLANETS_FOR_CONJUNCTIONS, ZODIAC_SIGNS
+)
+from utils.formatters import format_datetime_iso, round_decimal
+from utils.julian_date import julian_day_to_datetime
+from utils.root_finding import brent_root
+from lib.longitude_cache import calc_planet_position, get_year_longitudes
+
+# Aspect id of conjunctions, which are detected via exact-pass crossings
+CONJUNCTION = ASPECT_NAMES.index('conjunction')
+
+# Aspect ids checked by the orb-based daily scan
+ORB_ASPECT_IDS = tuple(aspect_id for aspect_id in range(len(ASPECT_NAMES)) if aspect_id != CONJUNCTION)
+
+# Pairs of outer planets, checked for every aspect
+OUTER_PAIRS = tuple(
+    (planet1, planet2)
+    for i, planet1 in enumerate(OUTER_PLANETS)
+    for planet2 in OUTER_PLANETS[i + 1:]
+)
+
+# Pairs checked for exact conjunction passes, with the largest daily
+# separation (degrees) that still counts as a pass rather than a wrap-around.
+# Venus and Mars move fast enough to need a wider limit than outer pairs.
+CONJUNCTION_PAIRS = tuple(
+    [(planet1, planet2, 15) for planet1, planet2 in OUTER_PAIRS] +
+    [(inner_planet, outer_planet, 20)
+     for inner_planet in INNER_PLANETS_FOR_CONJUNCTIONS
+     for outer_planet in OUTER_PLANETS]
+)
 
 
 def get_planet_longitude(jd: float, planet_name: str) -> float:
     """
     Get ecliptic longitude of a planet at given Julian Day.
 
+    Goes through the position cache shared with the other refiners.
+
     Args:
         jd: Julian Day number
         planet_name: Name of planet
@@ -21,9 +49,7 @@ def get_planet_longitude(jd: float, planet_name: str) -> float:
     Returns:
         Longitude in degrees (0-360)
     """
-    planet_id = PLANETS[planet_name]['id']
-    result = swe.calc_ut(jd, planet_id, SWEPH_FLAGS)
-    return result[0][0]
+    return calc_planet_position(jd, PLANETS[planet_name]['id'])[0]
 
 
 def calculate_aspect_angle(lon1: float, lon2: float) -> float:
@@ -37,11 +63,8 @@ def calculate_aspect_angle(lon1: float, lon2: float) -> float:
     Returns:
         Angular separation in degrees (0-180)
     """
-    diff = abs(lon2 - lon1) % 360
-    # Always return the smaller angle
-    if diff > 180:
-        diff = 360 - diff
-    return diff
+    # Fold to the smaller angle arithmetically rather than with a branch
+    return 180 - abs(abs(lon2 - lon1) % 360 - 180)
 
 
 def calculate_signed_separation(lon1: float, lon2: float) -> float:
@@ -57,10 +80,42 @@ def calculate_signed_separation(lon1: float, lon2: float) -> float:
     Returns:
         Signed separation in degrees (-180 to +180)
     """
-    diff = (lon1 - lon2) % 360
-    if diff > 180:
-        diff -= 360
-    return diff
+    # Shift, wrap and shift back instead of branching on the sign
+    return (lon1 - lon2 + 180) % 360 - 180
+
+
+def aspect_angle_series(lons1: List[float], lons2: List[float]) -> List[float]:
+    """
+    Calculate angular separations for two longitude series.
+
+    Same result as calculate_aspect_angle element by element, with the
+    arithmetic inlined to avoid a function call per sample.
+
+    Args:
+        lons1: First longitude series
+        lons2: Second longitude series
+
+    Returns:
+        Angular separations in degrees (0-180)
+    """
+    return [180 - abs(abs(lon2 - lon1) % 360 - 180) for lon1, lon2 in zip(lons1, lons2)]
+
+
+def signed_separation_series(lons1: List[float], lons2: List[float]) -> List[float]:
+    """
+    Calculate signed separations for two longitude series.
+
+    Same result as calculate_signed_separation element by element, with the
+    arithmetic inlined to avoid a function call per sample.
+
+    Args:
+        lons1: First planet longitude series
+        lons2: Second planet longitude series
+
+    Returns:
+        Signed separations in degrees (-180 to +180)
+    """
+    return [(lon1 - lon2 + 180) % 360 - 180 for lon1, lon2 in zip(lons1, lons2)]
 
 
 def is_in_aspect(angle: float, aspect_name: str) -> bool:
@@ -81,99 +136,185 @@ def is_in_aspect(angle: float, aspect_name: str) -> bool:
     return abs(angle - target_angle) <= orb
 
 
+def find_orb_entry_days(angles: List[float], windows: List[Tuple[float, float]]) -> List[List[int]]:
+    """
+    Find the days on which a daily separation series enters each aspect's orb.
+
+    All aspects are tested in a single pass over the series.
+
+    Args:
+        angles: Daily angular separations in degrees
+        windows: (target_angle, orb) pairs to test
+
+    Returns:
+        One list per window with the indices of days that are in orb when
+        the previous day was not
+    """
+    entry_days = [[] for _ in windows]
+    if not windows:
+        return entry_days
+
+    was_in_orb = [False] * len(windows)
+    any_in_orb = False
+    indexed_windows = list(enumerate(windows))
+
+    # Separations outside this range are out of every orb
+    lowest = min(target_angle - orb for target_angle, orb in windows)
+    highest = max(target_angle + orb for target_angle, orb in windows)
+
+    # Single pass with the orb test inlined - this is the hottest loop of the scan
+    for day, angle in enumerate(angles):
+        # Nothing can change on a day outside every window while no orb is active
+        if not any_in_orb and (angle < lowest or angle > highest):
+            continue
+
+        any_in_orb = False
+        for k, (target_angle, orb) in indexed_windows:
+            in_orb = abs(angle - target_angle) <= orb
+            if in_orb and not was_in_orb[k]:
+                entry_days[k].append(day)
+            was_in_orb[k] = in_orb
+            any_in_orb = any_in_orb or in_orb
+
+    return entry_days
+
+
+def find_separation_crossings(separations: List[float], limit: float) -> List[int]:
+    """
+    Find the days on which a daily signed separation series passes through zero.
+
+    Sign changes where either side is `limit` degrees or more from zero are
+    ignored, since those are wrap-arounds at +/-180 rather than exact passes.
+
+    Args:
+        separations: Daily signed separations in degrees
+        limit: Maximum separation on either side of a genuine pass
+
+    Returns:
+        Indices of days whose separation has the opposite sign to the previous day's
+    """
+    return [
+        day for day, (prev_sep, curr_sep) in enumerate(zip(separations, separations[1:]), start=1)
+        if prev_sep * curr_sep < 0 and abs(prev_sep) < limit and abs(curr_sep) < limit
+    ]
+
+
 def find_exact_aspect_time(start_jd: float, end_jd: float, planet1: str, planet2: str,
-                           target_angle: float, tolerance: float = 0.01) -> float:
+                           target_angle: float, tolerance: float = 1e-5) -> float:
     """
     Find exact time when two planets reach a specific aspect angle.
 
+    Uses Brent's method on the signed residual between the angular separation
+    and the target angle. If the aspect does not perfect within the window,
+    returns whichever end of the window is closest to exact.
+
     Args:
         start_jd: Starting Julian Day
         end_jd: Ending Julian Day
         planet1: Name of first planet
         planet2: Name of second planet
         target_angle: Target aspect angle
-        tolerance: Acceptable error in degrees
+        tolerance: Acceptable error in days
 
     Returns:
         Julian Day of exact aspect
     """
-    max_iterations = 50
-    iteration = 0
-
-    while iteration < max_iterations:
-        mid_jd = (start_jd + end_jd) / 2
-
-        lon1 = get_planet_longitude(mid_jd, planet1)
-        lon2 = get_planet_longitude(mid_jd, planet2)
-        current_angle = calculate_aspect_angle(lon1, lon2)
-
-        error = abs(current_angle - target_angle)
+    def residual(jd: float) -> float:
+        lon1 = get_planet_longitude(jd, planet1)
+        lon2 = get_planet_longitude(jd, planet2)
+        if target_angle >= 180:
+            # Separation folds at 180, so measure against the opposite point instead
+            return calculate_signed_separation(lon1, lon2 + 180)
+        return calculate_aspect_angle(lon1, lon2) - target_angle
 
-        if error < tolerance:
-            return mid_jd
+    start_residual = residual(start_jd)
+    end_residual = residual(end_jd)
 
-        # Determine which direction to search
-        # Sample slightly before and after to find gradient
-        test_jd = mid_jd + 0.1
-        test_lon1 = get_planet_longitude(test_jd, planet1)
-        test_lon2 = get_planet_longitude(test_jd, planet2)
-        test_angle = calculate_aspect_angle(test_lon1, test_lon2)
+    exact_jd = brent_root(residual, start_jd, end_jd, tolerance,
+                          fa=start_residual, fb=end_residual)
 
-        # If angle is increasing, we need to go backwards; if decreasing, go forwards
-        if abs(test_angle - target_angle) < abs(current_angle - target_angle):
-            # Getting closer, move forward
-            start_jd = mid_jd
-        else:
-            # Getting further, move backward
-            end_jd = mid_jd
+    if exact_jd is None:
+        # Not exact within the window - use the closest end
+        return start_jd if abs(start_residual) <= abs(end_residual) else end_jd
 
-        iteration += 1
-
-    return (start_jd + end_jd) / 2
+    return exact_jd
 
 
 def find_exact_conjunction_pass(start_jd: float, end_jd: float, planet1: str, planet2: str,
                                  tolerance: float = 0.001) -> float:
     """
     Find exact time when one planet passes another (conjunction exactness).
-    Uses signed separation to find the zero crossing.
+
+    Uses Brent's method on the signed separation, which changes sign at the
+    pass and is monotone near it.
 
     Args:
         start_jd: Starting Julian Day (before pass)
         end_jd: Ending Julian Day (after pass)
         planet1: Name of first planet
         planet2: Name of second planet
-        tolerance: Acceptable error in degrees
+        tolerance: Search stops once the root is known to within tolerance / 100 days
 
     Returns:
         Julian Day of exact conjunction pass
     """
-    max_iterations = 50
-    iteration = 0
+    def separation(jd: float) -> float:
+        return calculate_signed_separation(get_planet_longitude(jd, planet1),
+                                           get_planet_longitude(jd, planet2))
 
-    # Binary search for zero crossing of signed separation
-    while iteration < max_iterations and (end_jd - start_jd) > tolerance / 100:
-        mid_jd = (start_jd + end_jd) / 2
+    exact_jd = brent_root(separation, start_jd, end_jd, tolerance / 100)
 
-        lon1_start = get_planet_longitude(start_jd, planet1)
-        lon2_start = get_planet_longitude(start_jd, planet2)
-        sep_start = calculate_signed_separation(lon1_start, lon2_start)
+    if exact_jd is None:
+        # No sign change in the window - fall back to its midpoint
+        return (start_jd + end_jd) / 2
 
-        lon1_mid = get_planet_longitude(mid_jd, planet1)
-        lon2_mid = get_planet_longitude(mid_jd, planet2)
-        sep_mid = calculate_signed_separation(lon1_mid, lon2_mid)
+    return exact_jd
 
-        # Check if zero crossing is in first half or second half
-        if sep_start * sep_mid <= 0:
-            # Zero crossing in first half
-            end_jd = mid_jd
-        else:
-            # Zero crossing in second half
-            start_jd = mid_jd
 
-        iteration += 1
+def build_aspect_event(exact_jd: float, aspect_id: int, planet1: str, planet2: str) -> Dict[str, Any]:
+    """
+    Build the output record for an exact aspect.
 
-    return (start_jd + end_jd) / 2
+    Args:
+        exact_jd: Julian Day the aspect is exact
+        aspect_id: Index into the ASPECT_* lists
+        planet1: Name of first planet
+        planet2: Name of second planet
+
+    Returns:
+        Aspect event dictionary
+    """
+    exact_lon1 = get_planet_longitude(exact_jd, planet1)
+    exact_lon2 = get_planet_longitude(exact_jd, planet2)
+
+    # Swiss Ephemeris longitudes are already in 0-360, so one divmod gives sign and degree
+    sign_index1, degree1 = divmod(exact_lon1, 30)
+    sign_index2, degree2 = divmod(exact_lon2, 30)
+
+    exact_angle = calculate_aspect_angle(exact_lon1, exact_lon2)
+    exactness = abs(exact_angle - ASPECT_ANGLES[aspect_id])
+
+    return {
+        'type': 'aspect',
+        'aspect': ASPECT_NAMES[aspect_id],
+        'symbol': ASPECT_SYMBOLS[aspect_id],
+        'planet1': planet1,
+        'planet2': planet2,
+        'date': format_datetime_iso(julian_day_to_datetime(exact_jd)),
+        'julian_day': round_decimal(exact_jd),
+        'planet1_position': {
+            'longitude': round_decimal(exact_lon1),
+            'sign': ZODIAC_SIGNS[int(sign_index1)],
+            'degree': round_decimal(degree1)
+        },
+        'planet2_position': {
+            'longitude': round_decimal(exact_lon2),
+            'sign': ZODIAC_SIGNS[int(sign_index2)],
+            'degree': round_decimal(degree2)
+        },
+        'exactness': round_decimal(exactness, 8),
+        'orb_used': ASPECT_ORBS[aspect_id]
+    }
 
 
 def find_aspects(year: int) -> List[Dict[str, Any]]:
@@ -189,186 +330,68 @@ def find_aspects(year: int) -> List[Dict[str, Any]]:
     Returns:
         List of aspect events
     """
-    aspects_found = []
-
-    # Track active aspects for non-conjunction aspects (orb-based)
-    active_aspects = {}
-
-    # Track previous signed separations for conjunction exact pass detection
-    prev_separations = {}
-
-    # Scan through year at daily intervals
-    start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
-
-    current_date = start_date
-
-    while current_date < end_date:
-        current_jd = datetime_to_julian_day(current_date)
-
-        # Check all pairs of outer planets
-        for i, planet1 in enumerate(OUTER_PLANETS):
-            for planet2 in OUTER_PLANETS[i + 1:]:
-                lon1 = get_planet_longitude(current_jd, planet1)
-                lon2 = get_planet_longitude(current_jd, planet2)
-                angle = calculate_aspect_angle(lon1, lon2)
-
-                # CONJUNCTIONS: Detect each exact pass via signed separation crossing
-                conj_key = f"{planet1}-{planet2}-conjunction"
-                curr_sep = calculate_signed_separation(lon1, lon2)
-
-                if conj_key in prev_separations:
-                    prev_sep = prev_separations[conj_key]
-                    # Detect zero crossing (sign change) = exact conjunction pass
-                    if prev_sep * curr_sep < 0 and abs(prev_sep) < 15 and abs(curr_sep) < 15:
-                        # Found an exact pass - refine the time
-                        prev_jd = current_jd - 1.0
-                        exact_jd = find_exact_conjunction_pass(prev_jd, current_jd, planet1, planet2)
-
-                        # Get exact positions
-                        exact_lon1 = get_planet_longitude(exact_jd, planet1)
-                        exact_lon2 = get_planet_longitude(exact_jd, planet2)
-
-                        sign1, degree1 = get_zodiac_sign(exact_lon1)
-                        sign2, degree2 = get_zodiac_sign(exact_lon2)
-
-                        exact_angle = calculate_aspect_angle(exact_lon1, exact_lon2)
-
-                        aspect_info = {
-                            'type': 'aspect',
-                            'aspect': 'conjunction',
-                            'symbol': ASPECTS['conjunction']['symbol'],
-                            'planet1': planet1,
-                            'planet2': planet2,
-                            'date': format_datetime_iso(julian_day_to_datetime(exact_jd)),
-                            'julian_day': round_decimal(exact_jd),
-                            'planet1_position': {
-                                'longitude': round_decimal(exact_lon1),
-                                'sign': sign1,
-                                'degree': round_decimal(degree1)
-                            },
-                            'planet2_position': {
-                                'longitude': round_decimal(exact_lon2),
-                                'sign': sign2,
-                                'degree': round_decimal(degree2)
-                            },
-                            'exactness': round_decimal(exact_angle, 8),
-                            'orb_used': ASPECTS['conjunction']['orb']
-                        }
-                        aspects_found.append(aspect_info)
-
-                prev_separations[conj_key] = curr_sep
-
-                # OTHER ASPECTS: Use orb-based detection (unchanged)
-                for aspect_name, aspect_data in ASPECTS.items():
-                    if aspect_name == 'conjunction':
-                        continue  # Already handled above
-
-                    aspect_key = f"{planet1}-{planet2}-{aspect_name}"
-
-                    if is_in_aspect(angle, aspect_name):
-                        if aspect_key not in active_aspects:
-                            prev_jd = current_jd - 1.0
-                            exact_jd = find_exact_aspect_time(
-                                prev_jd, current_jd + 1.0,
-                                planet1, planet2,
-                                aspect_data['angle']
-                            )
-
-                            exact_lon1 = get_planet_longitude(exact_jd, planet1)
-                            exact_lon2 = get_planet_longitude(exact_jd, planet2)
-
-                            sign1, degree1 = get_zodiac_sign(exact_lon1)
-                            sign2, degree2 = get_zodiac_sign(exact_lon2)
-
-                            exact_angle = calculate_aspect_angle(exact_lon1, exact_lon2)
-                            exactness = abs(exact_angle - aspect_data['angle'])
-
-                            aspect_info = {
-                                'type': 'aspect',
-                                'aspect': aspect_name,
-                                'symbol': aspect_data['symbol'],
-                                'planet1': planet1,
-                                'planet2': planet2,
-                                'date': format_datetime_iso(julian_day_to_datetime(exact_jd)),
-                                'julian_day': round_decimal(exact_jd),
-                                'planet1_position': {
-                                    'longitude': round_decimal(exact_lon1),
-                                    'sign': sign1,
-                                    'degree': round_decimal(degree1)
-                                },
-                                'planet2_position': {
-                                    'longitude': round_decimal(exact_lon2),
-                                    'sign': sign2,
-                                    'degree': round_decimal(degree2)
-                                },
-                                'exactness': round_decimal(exactness, 8),
-                                'orb_used': aspect_data['orb']
-                            }
-
-                            aspects_found.append(aspect_info)
-                            active_aspects[aspect_key] = True
-                    else:
-                        if aspect_key in active_aspects:
-                            del active_aspects[aspect_key]
-
-        # Check conjunctions between inner planets (Venus, Mars) and outer planets
-        # Also use exact pass detection for these
-        for inner_planet in INNER_PLANETS_FOR_CONJUNCTIONS:
-            for outer_planet in OUTER_PLANETS:
-                lon1 = get_planet_longitude(current_jd, inner_planet)
-                lon2 = get_planet_longitude(current_jd, outer_planet)
-
-                conj_key = f"{inner_planet}-{outer_planet}-conjunction"
-                curr_sep = calculate_signed_separation(lon1, lon2)
-
-                if conj_key in prev_separations:
-                    prev_sep = prev_separations[conj_key]
-                    # Detect zero crossing (sign change) = exact conjunction pass
-                    if prev_sep * curr_sep < 0 and abs(prev_sep) < 20 and abs(curr_sep) < 20:
-                        prev_jd = current_jd - 1.0
-                        exact_jd = find_exact_conjunction_pass(prev_jd, current_jd, inner_planet, outer_planet)
-
-                        exact_lon1 = get_planet_longitude(exact_jd, inner_planet)
-                        exact_lon2 = get_planet_longitude(exact_jd, outer_planet)
-
-                        sign1, degree1 = get_zodiac_sign(exact_lon1)
-                        sign2, degree2 = get_zodiac_sign(exact_lon2)
-
-                        exact_angle = calculate_aspect_angle(exact_lon1, exact_lon2)
-
-                        aspect_info = {
-                            'type': 'aspect',
-                            'aspect': 'conjunction',
-                            'symbol': ASPECTS['conjunction']['symbol'],
-                            'planet1': inner_planet,
-                            'planet2': outer_planet,
-                            'date': format_datetime_iso(julian_day_to_datetime(exact_jd)),
-                            'julian_day': round_decimal(exact_jd),
-                            'planet1_position': {
-                                'longitude': round_decimal(exact_lon1),
-                                'sign': sign1,
-                                'degree': round_decimal(degree1)
-                            },
-                            'planet2_position': {
-                                'longitude': round_decimal(exact_lon2),
-                                'sign': sign2,
-                                'degree': round_decimal(degree2)
-                            },
-                            'exactness': round_decimal(exact_angle, 8),
-                            'orb_used': ASPECTS['conjunction']['orb']
-                        }
-
-                        aspects_found.append(aspect_info)
-
-                prev_separations[conj_key] = curr_sep
-
-        current_date += timedelta(days=1)
-
-    # Sort by date
-    aspects_found.sort(key=lambda x: x['julian_day'])
-
-    return aspects_found
+    # Detected events are collected column-wise and only turned into
+    # output records once the scan is finished
+    event_jds = []
+    event_aspect_ids = []
+    event_planets1 = []
+    event_planets2 = []
+
+    # Scan through year at daily intervals, using the shared daily samples
+    year_table = get_year_longitudes(year)
+    start_jd = year_table['start_jd']
+    num_days = year_table['num_days']
+    daily_lons = year_table['longitudes']
+
+    # CONJUNCTIONS: Detect each exact pass as a sign change in the pair's signed separation
+    for planet1, planet2, pass_limit in CONJUNCTION_PAIRS:
+        separations = signed_separation_series(daily_lons[planet1][:num_days],
+                                               daily_lons[planet2][:num_days])
+
+        for day in find_separation_crossings(separations, pass_limit):
+            # Found an exact pass - refine the time
+            current_jd = start_jd + day
+            prev_jd = current_jd - 1.0
+            event_jds.append(find_exact_conjunction_pass(prev_jd, current_jd, planet1, planet2))
+            event_aspect_ids.append(CONJUNCTION)
+            event_planets1.append(planet1)
+            event_planets2.append(planet2)
+
+    # OTHER ASPECTS: Orb-based detection over each pair's daily separation series
+    for planet1, planet2 in OUTER_PAIRS:
+        angles = aspect_angle_series(daily_lons[planet1][:num_days], daily_lons[planet2][:num_days])
+        min_angle = min(angles)
+        max_angle = max(angles)
+
+        # Skip aspects whose orb window the pair never reaches this year
+        candidate_ids = [
+            aspect_id for aspect_id in ORB_ASPECT_IDS
+            if not (ASPECT_ANGLES[aspect_id] - ASPECT_ORBS[aspect_id] > max_angle or
+                    ASPECT_ANGLES[aspect_id] + ASPECT_ORBS[aspect_id] < min_angle)
+        ]
+        windows = [(ASPECT_ANGLES[aspect_id], ASPECT_ORBS[aspect_id]) for aspect_id in candidate_ids]
+        entries = find_orb_entry_days(angles, windows)
+
+        for aspect_id, entry_days in zip(candidate_ids, entries):
+            for day in entry_days:
+                current_jd = start_jd + day
+                prev_jd = current_jd - 1.0
+                event_jds.append(find_exact_aspect_time(
+                    prev_jd, current_jd + 1.0,
+                    planet1, planet2,
+                    ASPECT_ANGLES[aspect_id]
+                ))
+                event_aspect_ids.append(aspect_id)
+                event_planets1.append(planet1)
+                event_planets2.append(planet2)
+
+    # Sort by date (on the rounded Julian Day that is written out)
+    order = sorted(range(len(event_jds)), key=lambda k: round_decimal(event_jds[k]))
+
+    return [
+        build_aspect_event(event_jds[k], event_aspect_ids[k], event_planets1[k], event_planets2[k])
+        for k in order
+    ]
 
 
 def generate_year_aspects(year: int, output_dir: str = '../data/major-transits') -> List[Dict[str, Any]]:
@@ -10,6 +10,9 @@ _ephe_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ephe')
 if os.path.exists(_ephe_path):
     swe.set_ephe_path(_ephe_path)
 
+# Ephemeris directory in use (None when Swiss Ephemeris uses its defaults)
+EPHE_PATH = _ephe_path if os.path.exists(_ephe_path) else None
+
 # Swiss Ephemeris planet constants
 # These map to pyswisseph.SUN, pyswisseph.MOON, etc.
 PLANETS = {
@@ -61,8 +64,15 @@ ASPECTS = {
     }
 }
 
+# The same aspect definitions as parallel lists indexed by aspect id,
+# for scan loops that should not look up the dict per iteration
+ASPECT_NAMES = list(ASPECTS)
+ASPECT_ANGLES = [ASPECTS[name]['angle'] for name in ASPECT_NAMES]
+ASPECT_ORBS = [ASPECTS[name]['orb'] for name in ASPECT_NAMES]
+ASPECT_SYMBOLS = [ASPECTS[name]['symbol'] for name in ASPECT_NAMES]
+
 # Zodiac signs (tropical)
-ZODIAC_SIGNS = [
+ZODIAC_SIGNS = (
     "Aries",
     "Taurus",
     "Gemini",
@@ -75,7 +85,10 @@ ZODIAC_SIGNS = [
     "Capricorn",
     "Aquarius",
     "Pisces"
-]
+)
+
+# Position of each sign in ZODIAC_SIGNS, for name -> index lookups
+SIGN_INDEX = {sign: index for index, sign in enumerate(ZODIAC_SIGNS)}
 
 # Swiss Ephemeris calculation flags
 # SEFLG_SWIEPH = 2 (use Swiss Ephemeris)
@@ -4,16 +4,30 @@ Generate curated annual event files consolidating the most important astrologica
 Pulls from existing generated data and filters to events relevant for general audiences.
 """
 
+import io
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from contextlib import redirect_stdout
+from functools import partial
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
-from utils.formatters import format_datetime_iso
+from utils.formatters import format_datetime_iso, load_json
 
 
+# Bump when the extraction rules or metadata tables below change, so curated
+# files written by older code are regenerated even if their sources are not
+CURATION_VERSION = 1
+
+# Moon phases included in curated files
+CARDINAL_PHASES = frozenset(('new', 'first_quarter', 'full', 'last_quarter'))
+
 # Planets to include for ingresses (slow-moving, significant sign changes)
 INGRESS_PLANETS = ['Neptune', 'Uranus', 'Saturn', 'Jupiter', 'Chiron', 'TrueNode']
 
+_INGRESS_PLANET_SET = frozenset(INGRESS_PLANETS)
+
 # Rare conjunction pairs (occur every 12+ years)
 RARE_CONJUNCTIONS = [
     ('Saturn', 'Neptune'),
@@ -31,6 +45,20 @@ RARE_CONJUNCTIONS = [
     ('Mars', 'Neptune'),
 ]
 
+# Title and description templates for major events
+INGRESS_TITLE = "{planet} enters {sign}"
+INGRESS_DESCRIPTION = "{planet} moves into {sign}, beginning a new phase of {theme}"
+CONJUNCTION_TITLE = "{planet1}-{planet2} Conjunction"
+CONJUNCTION_DESCRIPTION = "{planet1} and {planet2} align in {sign}, marking a significant cosmic event"
+
+# Curated sections written to JSON Lines files, with the '_kind' tag of their lines
+JSONL_SECTION_KINDS = (
+    ('moon_phases', 'moon_phase'),
+    ('eclipses', 'eclipse'),
+    ('retrogrades', 'retrograde'),
+    ('major_events', 'major_event')
+)
+
 # Conjunction frequencies and importance
 CONJUNCTION_METADATA = {
     ('Saturn', 'Neptune'): {
@@ -95,6 +123,17 @@ CONJUNCTION_METADATA = {
     },
 }
 
+# Order-independent lookups for the tables above
+_RARE_PAIRS = frozenset(frozenset(pair) for pair in RARE_CONJUNCTIONS)
+_CONJUNCTION_METADATA_BY_PAIR = {frozenset(pair): meta for pair, meta in CONJUNCTION_METADATA.items()}
+
+# Metadata for conjunction pairs missing from CONJUNCTION_METADATA
+_DEFAULT_CONJUNCTION_METADATA = {
+    'frequency': 'Unknown',
+    'importance': 'moderate',
+    'themes': []
+}
+
 # Ingress importance and themes
 INGRESS_METADATA = {
     'Neptune': {
@@ -131,11 +170,11 @@ INGRESS_METADATA = {
 
 
 def load_json_file(filepath: str) -> Optional[Dict]:
-    """Load a JSON file if it exists."""
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return None
+    """Load a JSON file if it exists (parsed with orjson when installed)."""
+    try:
+        return load_json(filepath)
+    except FileNotFoundError:
+        return None
 
 
 def extract_cardinal_moon_phases(moon_data: Dict) -> List[Dict[str, Any]]:
@@ -148,19 +187,16 @@ def extract_cardinal_moon_phases(moon_data: Dict) -> List[Dict[str, Any]]:
     Returns:
         List of moon phase events in curated format
     """
-    curated_phases = []
-    cardinal_phases = ['new', 'first_quarter', 'full', 'last_quarter']
-
-    for phase in moon_data.get('phases', []):
-        if phase.get('phase') in cardinal_phases:
-            curated_phases.append({
-                'date': phase['date'][:10],  # YYYY-MM-DD
-                'phase': phase['phase'],
-                'sign': phase['moon_sign'],
-                'degree': phase['moon_degree']
-            })
-
-    return curated_phases
+    return [
+        {
+            'date': phase['date'][:10],  # YYYY-MM-DD
+            'phase': phase['phase'],
+            'sign': phase['moon_sign'],
+            'degree': phase['moon_degree']
+        }
+        for phase in moon_data.get('phases', [])
+        if phase['phase'] in CARDINAL_PHASES
+    ]
 
 
 def extract_eclipses(eclipse_data: Dict) -> List[Dict[str, Any]]:
@@ -226,20 +262,63 @@ def extract_retrogrades(retro_data: Dict) -> List[Dict[str, Any]]:
 
 def is_rare_conjunction(planet1: str, planet2: str) -> bool:
     """Check if a conjunction pair is considered rare."""
-    pair = tuple(sorted([planet1, planet2]))
-    return any(tuple(sorted(p)) == pair for p in RARE_CONJUNCTIONS)
+    return frozenset((planet1, planet2)) in _RARE_PAIRS
 
 
 def get_conjunction_metadata(planet1: str, planet2: str) -> Dict[str, Any]:
-    """Get metadata for a conjunction pair."""
-    pair = tuple(sorted([planet1, planet2]))
-    for key, meta in CONJUNCTION_METADATA.items():
-        if tuple(sorted(key)) == pair:
-            return meta
+    """Get metadata for a conjunction pair (shared dicts; callers must not mutate them)."""
+    return _CONJUNCTION_METADATA_BY_PAIR.get(frozenset((planet1, planet2)), _DEFAULT_CONJUNCTION_METADATA)
+
+
+def _ingress_event(ingress: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a curated major event from a major-transits ingress entry."""
+    planet = ingress['planet']
+    meta = INGRESS_METADATA.get(planet, {})
+    themes = meta.get('themes')
+    lead_theme = themes[0] if themes else 'transformation'
+    to_sign = ingress.get('to_sign')
+
+    # Use friendly name for display
+    display_name = 'North Node' if planet == 'TrueNode' else planet
+    event_type = 'node_axis_shift' if planet == 'TrueNode' else 'planetary_ingress'
+
     return {
-        'frequency': 'Unknown',
-        'importance': 'moderate',
-        'themes': []
+        'date': ingress['date'][:10],
+        'type': event_type,
+        'planets': [display_name],
+        'from_sign': ingress.get('from_sign'),
+        'to_sign': to_sign,
+        'sign': to_sign,
+        'degree': ingress.get('degree', 0),
+        'title': INGRESS_TITLE.format(planet=display_name, sign=to_sign),
+        'description': INGRESS_DESCRIPTION.format(planet=display_name, sign=to_sign, theme=lead_theme),
+        'frequency': meta.get('frequency', 'Varies'),
+        'importance': meta.get('importance', 'major'),
+        'themes': themes or []
+    }
+
+
+def _conjunction_event(aspect: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a curated major event from a major-transits conjunction entry."""
+    planet1 = aspect['planet1']
+    planet2 = aspect['planet2']
+    meta = get_conjunction_metadata(planet1, planet2)
+    position = aspect.get('planet1_position', {})
+    sign = position.get('sign', 'Unknown')
+
+    return {
+        'date': aspect['date'][:10],
+        'type': 'conjunction',
+        'planets': [planet1, planet2],
+        'from_sign': None,
+        'to_sign': None,
+        'sign': sign,
+        'degree': position.get('degree', 0),
+        'title': CONJUNCTION_TITLE.format(planet1=planet1, planet2=planet2),
+        'description': CONJUNCTION_DESCRIPTION.format(planet1=planet1, planet2=planet2, sign=sign),
+        'frequency': meta.get('frequency', 'Rare'),
+        'importance': meta.get('importance', 'major'),
+        'themes': meta.get('themes', [])
     }
 
 
@@ -253,86 +332,141 @@ def extract_major_events(transit_data: Dict) -> List[Dict[str, Any]]:
     Returns:
         List of major events in curated format
     """
-    major_events = []
-
-    # Process ingresses
-    for ingress in transit_data.get('ingresses', []):
-        planet = ingress.get('planet')
-        if planet in INGRESS_PLANETS:
-            meta = INGRESS_METADATA.get(planet, {})
-
-            # Use friendly name for display
-            display_name = 'North Node' if planet == 'TrueNode' else planet
-            event_type = 'node_axis_shift' if planet == 'TrueNode' else 'planetary_ingress'
-
-            event = {
-                'date': ingress['date'][:10],
-                'type': event_type,
-                'planets': [display_name],
-                'from_sign': ingress.get('from_sign'),
-                'to_sign': ingress.get('to_sign'),
-                'sign': ingress.get('to_sign'),
-                'degree': ingress.get('degree', 0),
-                'title': f"{display_name} enters {ingress.get('to_sign')}",
-                'description': f"{display_name} moves into {ingress.get('to_sign')}, beginning a new phase of {meta.get('themes', ['transformation'])[0] if meta.get('themes') else 'transformation'}",
-                'frequency': meta.get('frequency', 'Varies'),
-                'importance': meta.get('importance', 'major'),
-                'themes': meta.get('themes', [])
-            }
-            major_events.append(event)
-
-    # Process conjunctions (only rare ones)
-    for aspect in transit_data.get('aspects', []):
-        if aspect.get('aspect') == 'conjunction':
-            planet1 = aspect.get('planet1')
-            planet2 = aspect.get('planet2')
-
-            if is_rare_conjunction(planet1, planet2):
-                meta = get_conjunction_metadata(planet1, planet2)
-                sign = aspect.get('planet1_position', {}).get('sign', 'Unknown')
-                degree = aspect.get('planet1_position', {}).get('degree', 0)
-
-                event = {
-                    'date': aspect['date'][:10],
-                    'type': 'conjunction',
-                    'planets': [planet1, planet2],
-                    'from_sign': None,
-                    'to_sign': None,
-                    'sign': sign,
-                    'degree': degree,
-                    'title': f"{planet1}-{planet2} Conjunction",
-                    'description': f"{planet1} and {planet2} align in {sign}, marking a significant cosmic event",
-                    'frequency': meta.get('frequency', 'Rare'),
-                    'importance': meta.get('importance', 'major'),
-                    'themes': meta.get('themes', [])
-                }
-                major_events.append(event)
+    major_events = [
+        _ingress_event(ingress)
+        for ingress in transit_data.get('ingresses', [])
+        if ingress.get('planet') in _INGRESS_PLANET_SET
+    ]
+
+    # Only rare conjunctions
+    major_events += [
+        _conjunction_event(aspect)
+        for aspect in transit_data.get('aspects', [])
+        if aspect.get('aspect') == 'conjunction' and is_rare_conjunction(aspect.get('planet1'), aspect.get('planet2'))
+    ]
 
     # Sort by date
-    major_events.sort(key=lambda x: x['date'])
+    major_events.sort(key=itemgetter('date'))
 
     return major_events
 
 
-def generate_curated_year(year: int, data_dir: str = '../data', output_dir: str = '../data/curated') -> Dict[str, Any]:
+def save_curated_jsonl(curated: Dict[str, Any], filepath: str) -> None:
+    """
+    Save a curated year as JSON Lines: one metadata line, then one line per event.
+
+    Each line carries a '_kind' field ('metadata', 'moon_phase', 'eclipse',
+    'retrograde' or 'major_event') so it can be processed on its own.
+
+    Args:
+        curated: Curated data structure
+        filepath: Path to output file
+    """
+    with open(filepath, 'w') as f:
+        f.write(json.dumps({'_kind': 'metadata', **curated['metadata']}, separators=(',', ':')) + '\n')
+        for section, kind in JSONL_SECTION_KINDS:
+            for event in curated[section]:
+                f.write(json.dumps({'_kind': kind, **event}, separators=(',', ':')) + '\n')
+
+
+def load_curated_jsonl(filepath: str) -> Dict[str, Any]:
+    """
+    Load a curated JSON Lines file back into the curated data structure.
+
+    Args:
+        filepath: Path to JSON Lines file written by save_curated_jsonl
+
+    Returns:
+        Curated data structure
+    """
+    curated = {'metadata': {}}
+    sections = {}
+    for section, kind in JSONL_SECTION_KINDS:
+        curated[section] = sections[kind] = []
+
+    with open(filepath, 'r') as f:
+        for line in f:
+            record = json.loads(line)
+            kind = record.pop('_kind')
+            if kind == 'metadata':
+                curated['metadata'] = record
+            else:
+                sections[kind].append(record)
+
+    return curated
+
+
+def is_up_to_date(output_file: str, source_files: List[str]) -> bool:
+    """
+    Check whether an output file is newer than all of its existing sources.
+
+    Args:
+        output_file: Path of the generated file
+        source_files: Paths of the files it is generated from (missing ones are ignored)
+
+    Returns:
+        True if the output exists and was modified after every source
+    """
+    try:
+        output_mtime = os.path.getmtime(output_file)
+    except OSError:
+        return False
+
+    source_mtimes = [os.path.getmtime(path) for path in source_files if os.path.exists(path)]
+    return output_mtime > max(source_mtimes, default=0)
+
+
+def generate_curated_year(year: int, data_dir: str = '../data', output_dir: str = '../data/curated',
+                          compact: bool = False, force: bool = False, output_format: str = 'json') -> Dict[str, Any]:
     """
     Generate curated annual event file for a given year.
 
+    If the output file is newer than all source files and was written with
+    the same CURATION_VERSION (and, for JSON, compact setting), it is loaded
+    and returned as-is, unless force is set.
+
     Args:
         year: Year to generate for
         data_dir: Base data directory
         output_dir: Output directory for curated files
+        compact: Write minified JSON (no indentation or spaces) instead of pretty-printed;
+            JSONL lines are always minified
+        force: Regenerate even if the output is up to date
+        output_format: 'json' for a single document or 'jsonl' for one line per event
 
     Returns:
         Curated data structure
     """
+    source_files = [
+        os.path.join(data_dir, 'moon-phases', f'{year}.json'),
+        os.path.join(data_dir, 'eclipses', f'{year}.json'),
+        os.path.join(data_dir, 'retrogrades', f'{year}.json'),
+        os.path.join(data_dir, 'major-transits', f'{year}.json')
+    ]
+    if output_format not in ('json', 'jsonl'):
+        raise ValueError(f"Unknown curated output format: {output_format}")
+
+    output_file = os.path.join(output_dir, f'{year}.{output_format}')
+
+    # Everything besides the sources that the written file depends on
+    build = {'curation_version': CURATION_VERSION}
+    if output_format == 'json':
+        build['compact'] = compact
+
+    if not force and is_up_to_date(output_file, source_files):
+        # An unreadable or foreign output file is simply regenerated
+        try:
+            existing = load_curated_jsonl(output_file) if output_format == 'jsonl' else load_json(output_file)
+            if existing['metadata'].get('build') == build:
+                print(f"Curated events for {year} are up to date, skipping")
+                return existing
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
     print(f"Generating curated events for {year}...")
 
     # Load source data
-    moon_data = load_json_file(os.path.join(data_dir, 'moon-phases', f'{year}.json'))
-    eclipse_data = load_json_file(os.path.join(data_dir, 'eclipses', f'{year}.json'))
-    retro_data = load_json_file(os.path.join(data_dir, 'retrogrades', f'{year}.json'))
-    transit_data = load_json_file(os.path.join(data_dir, 'major-transits', f'{year}.json'))
+    moon_data, eclipse_data, retro_data, transit_data = map(load_json_file, source_files)
 
     # Extract curated data from each source
     moon_phases = extract_cardinal_moon_phases(moon_data) if moon_data else []
@@ -351,6 +485,7 @@ def generate_curated_year(year: int, data_dir: str = '../data', output_dir: str
             'year': year,
             'generated_at': format_datetime_iso(datetime.now(timezone.utc)),
             'description': 'Curated astrological events for general audiences',
+            'build': build,
             'sources': {
                 'moon_phases': f'moon-phases/{year}.json',
                 'eclipses': f'eclipses/{year}.json',
@@ -364,35 +499,85 @@ def generate_curated_year(year: int, data_dir: str = '../data', output_dir: str
         'major_events': major_events
     }
 
-    # Save to file
+    # Save to file, via a temp file and rename so an interrupted run never
+    # leaves a truncated file that looks up to date
     os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f'{year}.json')
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
 
-    with open(output_file, 'w') as f:
-        json.dump(curated, f, indent=2)
+    if output_format == 'jsonl':
+        save_curated_jsonl(curated, tmp_file)
+    else:
+        with open(tmp_file, 'w') as f:
+            if compact:
+                json.dump(curated, f, separators=(',', ':'))
+            else:
+                json.dump(curated, f, indent=2)
+
+    os.replace(tmp_file, output_file)
 
     print(f"  Saved to {output_file}")
 
     return curated
 
 
-def generate_curated_years(years: List[int], data_dir: str = '../data', output_dir: str = '../data/curated') -> None:
+def _generate_curated_year_logged(year: int, **kwargs) -> str:
+    """
+    Generate a curated year in a worker process and return its progress output.
+
+    Args:
+        year: Year to generate for
+        **kwargs: Keyword arguments for generate_curated_year
+
+    Returns:
+        Everything generate_curated_year printed, for the parent to print in year order
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        generate_curated_year(year, **kwargs)
+    return buffer.getvalue()
+
+
+def generate_curated_years(years: List[int], data_dir: str = '../data', output_dir: str = '../data/curated',
+                           workers: Optional[int] = None, compact: bool = False, force: bool = False,
+                           output_format: str = 'json') -> None:
     """
     Generate curated annual event files for multiple years.
 
+    Years only read their own source files and write their own output file,
+    so they are generated in parallel worker processes.
+
     Args:
         years: List of years to generate
         data_dir: Base data directory
         output_dir: Output directory for curated files
+        workers: Number of worker processes (default: one per year, up to CPU count)
+        compact: Write minified JSON instead of pretty-printed
+        force: Regenerate years whose output is already up to date
+        output_format: 'json' or 'jsonl' (see generate_curated_year)
     """
+    if workers is None:
+        workers = min(len(years), os.cpu_count() or 1)
+
     print(f"\n{'='*60}")
     print(f"GENERATING CURATED EVENTS")
     print(f"Years: {', '.join(map(str, years))}")
     print(f"{'='*60}\n")
 
-    for year in years:
-        generate_curated_year(year, data_dir, output_dir)
-        print()
+    # Create the output directory once up front rather than from every worker
+    os.makedirs(output_dir, exist_ok=True)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers buffer their output; map yields it in year order, and
+            # consuming it re-raises worker exceptions here
+            logs = executor.map(partial(_generate_curated_year_logged, data_dir=data_dir, output_dir=output_dir,
+                                        compact=compact, force=force, output_format=output_format), years)
+            for log in logs:
+                print(log)
+    else:
+        for year in years:
+            generate_curated_year(year, data_dir, output_dir, compact, force, output_format)
+            print()
 
     print(f"{'='*60}")
     print(f"CURATED GENERATION COMPLETE!")
@@ -4,7 +4,9 @@ Calculate solar and lunar eclipses using Swiss Ephemeris.
 
 import swisseph as swe
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Any, Tuple
 from lib.config import SWEPH_FLAGS
 from utils.formatters import get_zodiac_sign, format_datetime_iso, round_decimal
 from utils.julian_date import datetime_to_julian_day, julian_day_to_datetime
@@ -21,6 +23,31 @@ ECLIPSE_TYPES = {
     swe.ECL_PENUMBRAL: 'penumbral',
 }
 
+# (flag, name) pairs in priority order; the first flag set in the result wins
+SOLAR_TYPE_ORDER = (
+    (swe.ECL_TOTAL, 'total'),
+    (swe.ECL_ANNULAR, 'annular'),
+    (swe.ECL_ANNULAR_TOTAL, 'hybrid'),
+    (swe.ECL_PARTIAL, 'partial'),
+)
+LUNAR_TYPE_ORDER = (
+    (swe.ECL_TOTAL, 'total'),
+    (swe.ECL_PENUMBRAL, 'penumbral'),
+    (swe.ECL_PARTIAL, 'partial'),
+)
+
+
+# Saros cycle length in days (~18 years, 11 days, 8 hours)
+SAROS_PERIOD = 6585.32
+
+# Reference eclipses with known recent Saros numbers, keyed by is_solar
+# Solar eclipse Jan 4, 2011 was Saros 151
+# Lunar eclipse Dec 21, 2010 was Saros 125
+SAROS_REFERENCES = {
+    True: (2455565.5, 151),
+    False: (2455551.5, 125)
+}
+
 
 def get_eclipse_type_name(eclipse_flags: int, is_solar: bool) -> str:
     """
@@ -33,22 +60,9 @@ def get_eclipse_type_name(eclipse_flags: int, is_solar: bool) -> str:
     Returns:
         Eclipse type name
     """
-    if is_solar:
-        if eclipse_flags & swe.ECL_TOTAL:
-            return 'total'
-        elif eclipse_flags & swe.ECL_ANNULAR:
-            return 'annular'
-        elif eclipse_flags & swe.ECL_ANNULAR_TOTAL:
-            return 'hybrid'
-        elif eclipse_flags & swe.ECL_PARTIAL:
-            return 'partial'
-    else:
-        if eclipse_flags & swe.ECL_TOTAL:
-            return 'total'
-        elif eclipse_flags & swe.ECL_PENUMBRAL:
-            return 'penumbral'
-        elif eclipse_flags & swe.ECL_PARTIAL:
-            return 'partial'
+    for flag, name in SOLAR_TYPE_ORDER if is_solar else LUNAR_TYPE_ORDER:
+        if eclipse_flags & flag:
+            return name
 
     return 'unknown'
 
@@ -67,30 +81,16 @@ def get_saros_series(jd: float, is_solar: bool) -> int:
     Returns:
         Approximate Saros series number
     """
-    # Reference eclipses (approximate starting points)
-    # Solar: Saros 1 started around 2872 BC
-    # Lunar: Similar ancient origin
-
-    # Use a simpler approximation based on known recent Saros numbers
-    # Solar eclipse Jan 4, 2011 was Saros 151
-    # Lunar eclipse Dec 21, 2010 was Saros 125
-
-    saros_period = 6585.32  # days
-
-    if is_solar:
-        ref_jd = 2455565.5  # Jan 4, 2011
-        ref_saros = 151
-    else:
-        ref_jd = 2455551.5  # Dec 21, 2010
-        ref_saros = 125
+    ref_jd, ref_saros = SAROS_REFERENCES[is_solar]
 
     # Calculate cycles from reference
-    cycles = (jd - ref_jd) / saros_period
+    cycles = (jd - ref_jd) / SAROS_PERIOD
     saros = ref_saros + round(cycles)
 
     return saros
 
 
+@lru_cache(maxsize=256)
 def get_eclipse_description(eclipse_type: str, is_solar: bool, sign: str) -> str:
     """
     Generate a human-readable description for an eclipse.
@@ -124,17 +124,23 @@ def get_eclipse_description(eclipse_type: str, is_solar: bool, sign: str) -> str
             return f"Partial Lunar Eclipse in {sign} - Earth's shadow partially covers Moon"
 
 
-def find_solar_eclipses(year: int) -> List[Dict[str, Any]]:
+def _scan_eclipse_jds(year: int, is_solar: bool) -> Tuple[List[float], List[int]]:
     """
-    Find all solar eclipses in a given year.
+    Find the time of maximum and the flags of every eclipse in a year.
 
     Args:
         year: Year to find eclipses for
+        is_solar: True for solar eclipses, False for lunar
 
     Returns:
-        List of solar eclipse events
+        Tuple of parallel (eclipse_jds, eclipse_flags) lists in date order
     """
-    eclipses = []
+    # Solar returns: (return_flag, [jd_max, jd_first, jd_second, jd_third, jd_fourth, ...])
+    # Lunar returns: (return_flag, [jd_max, jd_partial_begin, jd_partial_end, jd_total_begin, jd_total_end, ...])
+    eclipse_when = swe.sol_eclipse_when_glob if is_solar else swe.lun_eclipse_when
+
+    eclipse_jds = []
+    flags = []
 
     # Start from beginning of year
     start_jd = datetime_to_julian_day(datetime(year, 1, 1, tzinfo=timezone.utc))
@@ -143,16 +149,12 @@ def find_solar_eclipses(year: int) -> List[Dict[str, Any]]:
     current_jd = start_jd
 
     while current_jd < end_jd:
-        # Find next solar eclipse globally
-        # Returns: (return_flag, [jd_max, jd_first, jd_second, jd_third, jd_fourth, ...])
-        result = swe.sol_eclipse_when_glob(current_jd, SWEPH_FLAGS)
+        eclipse_flags, eclipse_times = eclipse_when(current_jd, SWEPH_FLAGS)
 
-        if result[0] == 0:
+        if eclipse_flags == 0:
             # No eclipse found
             break
 
-        eclipse_flags = result[0]
-        eclipse_times = result[1]
         eclipse_jd = eclipse_times[0]  # Time of maximum eclipse
 
         # Check if eclipse is within our year
@@ -160,129 +162,120 @@ def find_solar_eclipses(year: int) -> List[Dict[str, Any]]:
             break
 
         if eclipse_jd >= start_jd:
-            # Get eclipse type
-            eclipse_type = get_eclipse_type_name(eclipse_flags, is_solar=True)
-
-            # Get Sun and Moon positions at eclipse time
-            sun_pos = swe.calc_ut(eclipse_jd, swe.SUN, SWEPH_FLAGS)[0]
-            moon_pos = swe.calc_ut(eclipse_jd, swe.MOON, SWEPH_FLAGS)[0]
-
-            sun_lon = sun_pos[0]
-            moon_lon = moon_pos[0]
-
-            # Eclipse occurs at the Moon's position (New Moon for solar)
-            sign, degree = get_zodiac_sign(moon_lon)
-
-            # Get geographic visibility (central line)
-            # swe.sol_eclipse_where returns [longitude, latitude, ...]
-            try:
-                where_result = swe.sol_eclipse_where(eclipse_jd, SWEPH_FLAGS)
-                geo_lon = where_result[0][0]
-                geo_lat = where_result[0][1]
-                visibility = f"Maximum visibility near {abs(geo_lat):.1f}°{'N' if geo_lat >= 0 else 'S'}, {abs(geo_lon):.1f}°{'E' if geo_lon >= 0 else 'W'}"
-            except:
-                visibility = "Global visibility varies by location"
-
-            # Get Saros series
-            saros = get_saros_series(eclipse_jd, is_solar=True)
-
-            eclipse_data = {
-                'type': 'solar',
-                'eclipse_type': eclipse_type,
-                'date': format_datetime_iso(julian_day_to_datetime(eclipse_jd)),
-                'julian_day': round_decimal(eclipse_jd),
-                'sun_longitude': round_decimal(sun_lon),
-                'moon_longitude': round_decimal(moon_lon),
-                'sign': sign,
-                'degree': round_decimal(degree),
-                'saros_series': saros,
-                'description': get_eclipse_description(eclipse_type, True, sign),
-                'visibility': visibility
-            }
-
-            eclipses.append(eclipse_data)
+            eclipse_jds.append(eclipse_jd)
+            flags.append(eclipse_flags)
 
         # Move to next eclipse (at least 25 days later)
         current_jd = eclipse_jd + 25
 
-    return eclipses
+    return eclipse_jds, flags
 
 
-def find_lunar_eclipses(year: int) -> List[Dict[str, Any]]:
+def _sun_moon_longitudes(eclipse_jds: List[float]) -> Tuple[List[float], List[float]]:
     """
-    Find all lunar eclipses in a given year.
+    Calculate Sun and Moon longitudes at each eclipse time in one pass.
 
     Args:
-        year: Year to find eclipses for
+        eclipse_jds: Julian Days of maximum eclipse
 
     Returns:
-        List of lunar eclipse events
+        Tuple of parallel (sun_longitudes, moon_longitudes) lists
     """
-    eclipses = []
-
-    # Start from beginning of year
-    start_jd = datetime_to_julian_day(datetime(year, 1, 1, tzinfo=timezone.utc))
-    end_jd = datetime_to_julian_day(datetime(year + 1, 1, 1, tzinfo=timezone.utc))
-
-    current_jd = start_jd
+    sun_lons = [swe.calc_ut(jd, swe.SUN, SWEPH_FLAGS)[0][0] for jd in eclipse_jds]
+    moon_lons = [swe.calc_ut(jd, swe.MOON, SWEPH_FLAGS)[0][0] for jd in eclipse_jds]
+    return sun_lons, moon_lons
+
+
+def _solar_eclipse_visibility(eclipse_jd: float) -> str:
+    """Describe where a solar eclipse is best seen (its central line at maximum)."""
+    # swe.sol_eclipse_where returns [longitude, latitude, ...]
+    try:
+        where_result = swe.sol_eclipse_where(eclipse_jd, SWEPH_FLAGS)
+        geo_lon = where_result[0][0]
+        geo_lat = where_result[0][1]
+        return f"Maximum visibility near {abs(geo_lat):.1f}°{'N' if geo_lat >= 0 else 'S'}, {abs(geo_lon):.1f}°{'E' if geo_lon >= 0 else 'W'}"
+    except Exception:
+        return "Global visibility varies by location"
+
+
+def _build_eclipse_events(is_solar: bool, eclipse_jds: List[float], flags: List[int],
+                          sun_lons: List[float], moon_lons: List[float],
+                          visibilities: List[str]) -> List[Dict[str, Any]]:
+    """
+    Turn parallel per-eclipse columns into the list of eclipse event dicts.
 
-    while current_jd < end_jd:
-        # Find next lunar eclipse
-        # Returns: (return_flag, [jd_max, jd_partial_begin, jd_partial_end, jd_total_begin, jd_total_end, ...])
-        result = swe.lun_eclipse_when(current_jd, SWEPH_FLAGS)
+    Args:
+        is_solar: True for solar eclipses, False for lunar
+        eclipse_jds: Julian Days of maximum eclipse
+        flags: Swiss Ephemeris eclipse flags
+        sun_lons: Sun longitudes at maximum
+        moon_lons: Moon longitudes at maximum
+        visibilities: Visibility descriptions
 
-        if result[0] == 0:
-            # No eclipse found
-            break
+    Returns:
+        List of eclipse events
+    """
+    kind = 'solar' if is_solar else 'lunar'
+    eclipse_types = [get_eclipse_type_name(eclipse_flags, is_solar) for eclipse_flags in flags]
+
+    # Eclipse occurs at the Moon's position (New Moon for solar, Full Moon for lunar)
+    signs = [get_zodiac_sign(moon_lon) for moon_lon in moon_lons]
+
+    return [
+        {
+            'type': kind,
+            'eclipse_type': eclipse_type,
+            'date': format_datetime_iso(julian_day_to_datetime(eclipse_jd)),
+            'julian_day': round_decimal(eclipse_jd),
+            'sun_longitude': round_decimal(sun_lon),
+            'moon_longitude': round_decimal(moon_lon),
+            'sign': sign,
+            'degree': round_decimal(degree),
+            'saros_series': get_saros_series(eclipse_jd, is_solar),
+            'description': get_eclipse_description(eclipse_type, is_solar, sign),
+            'visibility': visibility
+        }
+        for eclipse_jd, eclipse_type, sun_lon, moon_lon, (sign, degree), visibility
+        in zip(eclipse_jds, eclipse_types, sun_lons, moon_lons, signs, visibilities)
+    ]
 
-        eclipse_flags = result[0]
-        eclipse_times = result[1]
-        eclipse_jd = eclipse_times[0]  # Time of maximum eclipse
 
-        # Check if eclipse is within our year
-        if eclipse_jd >= end_jd:
-            break
+def find_solar_eclipses(year: int) -> List[Dict[str, Any]]:
+    """
+    Find all solar eclipses in a given year.
 
-        if eclipse_jd >= start_jd:
-            # Get eclipse type
-            eclipse_type = get_eclipse_type_name(eclipse_flags, is_solar=False)
+    Args:
+        year: Year to find eclipses for
 
-            # Get Sun and Moon positions at eclipse time
-            sun_pos = swe.calc_ut(eclipse_jd, swe.SUN, SWEPH_FLAGS)[0]
-            moon_pos = swe.calc_ut(eclipse_jd, swe.MOON, SWEPH_FLAGS)[0]
+    Returns:
+        List of solar eclipse events
+    """
+    eclipse_jds, flags = _scan_eclipse_jds(year, is_solar=True)
+    sun_lons, moon_lons = _sun_moon_longitudes(eclipse_jds)
 
-            sun_lon = sun_pos[0]
-            moon_lon = moon_pos[0]
+    # Get geographic visibility (central line)
+    visibilities = [_solar_eclipse_visibility(eclipse_jd) for eclipse_jd in eclipse_jds]
 
-            # Eclipse occurs at the Moon's position (Full Moon for lunar)
-            sign, degree = get_zodiac_sign(moon_lon)
+    return _build_eclipse_events(True, eclipse_jds, flags, sun_lons, moon_lons, visibilities)
 
-            # Lunar eclipses visible from anywhere Moon is above horizon
-            visibility = "Visible from anywhere the Moon is above the horizon"
 
-            # Get Saros series
-            saros = get_saros_series(eclipse_jd, is_solar=False)
+def find_lunar_eclipses(year: int) -> List[Dict[str, Any]]:
+    """
+    Find all lunar eclipses in a given year.
 
-            eclipse_data = {
-                'type': 'lunar',
-                'eclipse_type': eclipse_type,
-                'date': format_datetime_iso(julian_day_to_datetime(eclipse_jd)),
-                'julian_day': round_decimal(eclipse_jd),
-                'sun_longitude': round_decimal(sun_lon),
-                'moon_longitude': round_decimal(moon_lon),
-                'sign': sign,
-                'degree': round_decimal(degree),
-                'saros_series': saros,
-                'description': get_eclipse_description(eclipse_type, False, sign),
-                'visibility': visibility
-            }
+    Args:
+        year: Year to find eclipses for
 
-            eclipses.append(eclipse_data)
+    Returns:
+        List of lunar eclipse events
+    """
+    eclipse_jds, flags = _scan_eclipse_jds(year, is_solar=False)
+    sun_lons, moon_lons = _sun_moon_longitudes(eclipse_jds)
 
-        # Move to next eclipse (at least 25 days later)
-        current_jd = eclipse_jd + 25
+    # Lunar eclipses visible from anywhere Moon is above horizon
+    visibilities = ["Visible from anywhere the Moon is above the horizon"] * len(eclipse_jds)
 
-    return eclipses
+    return _build_eclipse_events(False, eclipse_jds, flags, sun_lons, moon_lons, visibilities)
 
 
 def find_all_eclipses(year: int) -> List[Dict[str, Any]]:
@@ -299,7 +292,7 @@ def find_all_eclipses(year: int) -> List[Dict[str, Any]]:
     lunar = find_lunar_eclipses(year)
 
     all_eclipses = solar + lunar
-    all_eclipses.sort(key=lambda x: x['julian_day'])
+    all_eclipses.sort(key=itemgetter('julian_day'))
 
     return all_eclipses
 
@@ -2,73 +2,61 @@
 Calculate planetary ingresses (sign changes).
 """
 
-import swisseph as swe
-from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Dict, List, Any
-from lib.config import PLANETS, SWEPH_FLAGS, ZODIAC_SIGNS
-from utils.formatters import get_zodiac_sign, format_datetime_iso, round_decimal
-from utils.julian_date import datetime_to_julian_day, julian_day_to_datetime
+from lib.config import PLANETS, ZODIAC_SIGNS
+from utils.formatters import angular_difference, get_zodiac_sign, format_datetime_iso, round_decimal
+from utils.julian_date import julian_day_to_datetime
+from utils.root_finding import brent_root
+from lib.longitude_cache import calc_planet_position, get_year_longitudes
 
 
-def get_planet_position(jd: float, planet_name: str) -> tuple[float, float]:
+def get_planet_position(jd: float, planet_id: int) -> tuple[float, float]:
     """
     Get planet longitude and speed at given Julian Day.
 
     Args:
         jd: Julian Day number
-        planet_name: Name of planet
+        planet_id: Swiss Ephemeris planet ID (resolve once via PLANETS)
 
     Returns:
         Tuple of (longitude, speed)
     """
-    planet_id = PLANETS[planet_name]['id']
-    result = swe.calc_ut(jd, planet_id, SWEPH_FLAGS)
-    longitude = result[0][0]
-    speed = result[0][3]  # Longitudinal speed
-    return longitude, speed
+    return calc_planet_position(jd, planet_id)
 
 
 def find_exact_ingress_time(start_jd: float, end_jd: float, planet_name: str,
-                            sign_boundary: float, tolerance: float = 0.001) -> float:
+                            sign_boundary: float, tolerance: float = 1e-6) -> float:
     """
     Find exact time when planet crosses a sign boundary.
 
+    Uses Brent's method on the signed distance from the boundary, so
+    direct and retrograde crossings are handled the same way.
+
     Args:
         start_jd: Starting Julian Day
         end_jd: Ending Julian Day
         planet_name: Name of planet
         sign_boundary: Target longitude (0, 30, 60, ..., 330)
-        tolerance: Acceptable error in degrees
+        tolerance: Acceptable error in the time (days)
 
     Returns:
         Julian Day of exact ingress
     """
-    max_iterations = 50
-    iteration = 0
-
-    while iteration < max_iterations:
-        mid_jd = (start_jd + end_jd) / 2
-        lon, speed = get_planet_position(mid_jd, planet_name)
-
-        # Normalize longitude to match sign boundary
-        if sign_boundary == 0:
-            # Handle Pisces -> Aries crossing (330-360 -> 0-30)
-            if lon > 300:
-                lon = lon - 360
-
-        error = lon - sign_boundary
+    planet_id = PLANETS[planet_name]['id']
 
-        if abs(error) < tolerance:
-            return mid_jd
+    def distance_from_boundary(jd: float) -> float:
+        lon, _ = get_planet_position(jd, planet_id)
+        # Signed distance stays continuous across the 360 -> 0 crossing
+        return angular_difference(lon, sign_boundary)
 
-        if error > 0:
-            end_jd = mid_jd
-        else:
-            start_jd = mid_jd
+    exact_jd = brent_root(distance_from_boundary, start_jd, end_jd, tolerance)
 
-        iteration += 1
+    if exact_jd is None:
+        # Boundary not crossed within the window - fall back to its midpoint
+        return (start_jd + end_jd) / 2
 
-    return (start_jd + end_jd) / 2
+    return exact_jd
 
 
 def detect_sign_crossing(prev_lon: float, curr_lon: float) -> int | None:
@@ -97,6 +85,23 @@ def detect_sign_crossing(prev_lon: float, curr_lon: float) -> int | None:
     return None
 
 
+def find_sign_change_days(longitudes: List[float]) -> List[int]:
+    """
+    Find the days on which a daily longitude series is in a different sign than the day before.
+
+    Args:
+        longitudes: Daily longitudes in degrees (0-360)
+
+    Returns:
+        Indices of days whose sign differs from the previous day's
+    """
+    sign_indices = [int(lon / 30) for lon in longitudes]
+    return [
+        day for day, (prev_sign, curr_sign) in enumerate(zip(sign_indices, sign_indices[1:]), start=1)
+        if prev_sign != curr_sign
+    ]
+
+
 def find_ingresses(year: int, planet_names: List[str] = None) -> List[Dict[str, Any]]:
     """
     Find all sign ingresses for specified planets in a given year.
@@ -113,18 +118,19 @@ def find_ingresses(year: int, planet_names: List[str] = None) -> List[Dict[str,
 
     ingresses = []
 
-    # Scan through year at daily intervals
-    start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    # Scan through year at daily intervals, using the shared daily samples
+    year_table = get_year_longitudes(year)
+    start_jd = year_table['start_jd']
 
     for planet_name in planet_names:
-        current_date = start_date
-        prev_lon, _ = get_planet_position(datetime_to_julian_day(current_date), planet_name)
+        planet_id = PLANETS[planet_name]['id']
+        daily_lons = year_table['longitudes'][planet_name]
 
-        while current_date < end_date:
-            current_date += timedelta(days=1)
-            current_jd = datetime_to_julian_day(current_date)
-            curr_lon, _ = get_planet_position(current_jd, planet_name)
+        # Only days where the sign changed can hold an ingress
+        for day in find_sign_change_days(daily_lons):
+            current_jd = start_jd + day
+            prev_lon = daily_lons[day - 1]
+            curr_lon = daily_lons[day]
 
             # Check for sign crossing
             boundary = detect_sign_crossing(prev_lon, curr_lon)
@@ -135,7 +141,7 @@ def find_ingresses(year: int, planet_names: List[str] = None) -> List[Dict[str,
                 exact_jd = find_exact_ingress_time(prev_jd, current_jd, planet_name, boundary)
 
                 # Get exact longitude at ingress
-                exact_lon, _ = get_planet_position(exact_jd, planet_name)
+                exact_lon, _ = get_planet_position(exact_jd, planet_id)
 
                 # Determine from and to signs
                 from_sign_index = int(prev_lon / 30)
@@ -156,10 +162,8 @@ def find_ingresses(year: int, planet_names: List[str] = None) -> List[Dict[str,
 
                 ingresses.append(ingress_info)
 
-            prev_lon = curr_lon
-
     # Sort by date
-    ingresses.sort(key=lambda x: x['julian_day'])
+    ingresses.sort(key=itemgetter('julian_day'))
 
     return ingresses
 
@@ -0,0 +1,175 @@
+"""
+Shared table of daily planet positions (longitude, latitude, distance and
+speed) for a year.
+
+Aspects, ingresses, retrogrades, moon phases and the daily position files
+all sample the same year at midnight UTC, so the samples are computed once
+per year and reused. Tables are memoized in-process and persisted as JSON
+to scripts/.cache across runs.
+
+Off-grid positions used by the exact-time refiners go through a small
+in-process cache as well, since the refiners re-read the times they solved for.
+"""
+
+import json
+import os
+import swisseph as swe
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from lib.config import EPHE_PATH, PLANETS, SWEPH_FLAGS
+from utils.formatters import load_json
+from utils.julian_date import datetime_to_julian_day
+
+# Bump when the table layout changes to invalidate persisted copies
+CACHE_VERSION = 3
+
+# Persisted tables live next to the scripts, not in the shared temp directory
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+
+
+def _cache_key() -> Dict[str, Any]:
+    """
+    Everything a persisted table depends on besides the year.
+
+    Swiss Ephemeris silently falls back to the Moshier ephemeris when its
+    data files are missing, so the ephemeris directory and the files in it
+    are part of the key.
+    """
+    ephe_files = sorted(os.listdir(EPHE_PATH)) if EPHE_PATH is not None else []
+    return {
+        'version': CACHE_VERSION,
+        'swe_version': swe.version,
+        'flags': SWEPH_FLAGS,
+        'planets': [[name, data['id']] for name, data in PLANETS.items()],
+        'ephe_path': EPHE_PATH,
+        'ephe_files': ephe_files
+    }
+
+
+def _cache_path(year: int) -> str:
+    """Path of the persisted table for a year."""
+    return os.path.join(CACHE_DIR, f"longitudes_{year}.json")
+
+
+@lru_cache(maxsize=65536)
+def calc_planet_position(jd: float, planet_id: int) -> Tuple[float, float]:
+    """
+    Get a planet's longitude and speed at a Julian Day, memoized on the exact time.
+
+    Args:
+        jd: Julian Day number
+        planet_id: Swiss Ephemeris planet ID
+
+    Returns:
+        Tuple of (longitude, speed)
+    """
+    position = swe.calc_ut(jd, planet_id, SWEPH_FLAGS)[0]
+    return position[0], position[3]
+
+
+def sample_planet_daily(planet_id: int, start_jd: float, num_samples: int,
+                        flags: int = SWEPH_FLAGS) -> Tuple[List[float], List[float], List[float], List[float]]:
+    """
+    Sample one planet's position at consecutive daily steps.
+
+    Args:
+        planet_id: Swiss Ephemeris planet ID
+        start_jd: Julian Day of the first sample
+        num_samples: Number of daily samples
+        flags: Swiss Ephemeris calculation flags
+
+    Returns:
+        Tuple of (longitudes, latitudes, distances, speeds) lists
+    """
+    calc_ut = swe.calc_ut
+    positions = [calc_ut(start_jd + day, planet_id, flags)[0] for day in range(num_samples)]
+    return (
+        [position[0] for position in positions],
+        [position[1] for position in positions],
+        [position[2] for position in positions],
+        [position[3] for position in positions]
+    )
+
+
+def compute_year_longitudes(year: int) -> Dict[str, Any]:
+    """
+    Sample every planet once per day for a year.
+
+    Samples run from midnight UTC on January 1 through midnight UTC on
+    January 1 of the following year (inclusive), so day-over-day scans can
+    compare the last day of the year against the next one.
+
+    Args:
+        year: Year to sample
+
+    Returns:
+        Dictionary with 'start_jd', 'num_days', and per-planet 'longitudes',
+        'latitudes', 'distances' (AU) and 'speeds' lists indexed by day
+    """
+    start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+
+    start_jd = datetime_to_julian_day(start_date)
+    num_days = (end_date - start_date).days
+
+    longitudes = {}
+    latitudes = {}
+    distances = {}
+    speeds = {}
+
+    for planet_name, planet_data in PLANETS.items():
+        (longitudes[planet_name], latitudes[planet_name],
+         distances[planet_name], speeds[planet_name]) = sample_planet_daily(planet_data['id'], start_jd, num_days + 1)
+
+    return {
+        'start_jd': start_jd,
+        'num_days': num_days,
+        'longitudes': longitudes,
+        'latitudes': latitudes,
+        'distances': distances,
+        'speeds': speeds
+    }
+
+
+@lru_cache(maxsize=8)
+def get_year_longitudes(year: int) -> Dict[str, Any]:
+    """
+    Get the daily longitude table for a year, computing it at most once.
+
+    The returned table is shared between callers and must not be mutated.
+
+    Args:
+        year: Year to sample
+
+    Returns:
+        Table as returned by compute_year_longitudes
+    """
+    cache_path = _cache_path(year)
+    key = _cache_key()
+
+    # JSON holds plain data only, and repr-formatted floats round-trip exactly
+    try:
+        cached = load_json(cache_path)
+        if cached['key'] == key:
+            return cached['table']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    table = compute_year_longitudes(year)
+
+    # Write to a temp file and rename so concurrent workers never see a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'table': table}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Persisting is best effort; never leave a partial file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return table
@@ -1,30 +1,38 @@
 """
-Calculate exact times of moon phases using binary search.
+Calculate exact times of moon phases using root finding.
 """
 
 import swisseph as swe
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Tuple
-from lib.config import PLANETS, SWEPH_FLAGS, MOON_PHASES
-from utils.formatters import get_zodiac_sign, format_datetime_iso, round_decimal
-from utils.julian_date import datetime_to_julian_day, julian_day_to_datetime
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+from lib.config import PLANETS, MOON_PHASES
+from utils.formatters import angular_difference, get_zodiac_sign, format_datetime_iso, round_decimal
+from utils.julian_date import julian_day_to_datetime
+from utils.root_finding import brent_root
+from lib.longitude_cache import calc_planet_position, get_year_longitudes
 
+# Planet IDs used on every angle evaluation, resolved once
+_SUN_ID = PLANETS['Sun']['id']
+_MOON_ID = PLANETS['Moon']['id']
 
-def get_sun_moon_angle(jd: float) -> float:
+
+def get_sun_moon_angle(jd: float, sun_lon: Optional[float] = None, moon_lon: Optional[float] = None) -> float:
     """
     Calculate the angle between Sun and Moon (in degrees).
 
     Args:
         jd: Julian Day number
+        sun_lon: Sun longitude at jd, if already known
+        moon_lon: Moon longitude at jd, if already known
 
     Returns:
         Angle in degrees (0-360)
     """
-    sun_pos = swe.calc_ut(jd, PLANETS['Sun']['id'], SWEPH_FLAGS)[0]
-    moon_pos = swe.calc_ut(jd, PLANETS['Moon']['id'], SWEPH_FLAGS)[0]
-
-    sun_lon = sun_pos[0]
-    moon_lon = moon_pos[0]
+    if sun_lon is None:
+        sun_lon, _ = calc_planet_position(jd, _SUN_ID)
+    if moon_lon is None:
+        moon_lon, _ = calc_planet_position(jd, _MOON_ID)
 
     # Calculate angle difference
     angle = (moon_lon - sun_lon) % 360
@@ -95,49 +103,30 @@ def get_moon_phase_emoji(phase_name: str) -> str:
     return emojis.get(phase_name, '🌙')
 
 
-def find_exact_phase_time(start_jd: float, end_jd: float, target_angle: float, tolerance: float = 0.01) -> float:
+def find_exact_phase_time(start_jd: float, end_jd: float, target_angle: float, tolerance: float = 1e-6) -> float:
     """
-    Use binary search to find exact Julian Day when Sun-Moon angle matches target.
+    Use Brent's method to find exact Julian Day when Sun-Moon angle matches target.
 
     Args:
         start_jd: Starting Julian Day
         end_jd: Ending Julian Day
         target_angle: Target angle in degrees (0, 90, 180, 270)
-        tolerance: Acceptable error in degrees (default 0.01 = ~0.6 arcminutes)
+        tolerance: Acceptable error in the time (default 1e-6 days = ~0.09 seconds)
 
     Returns:
         Julian Day of exact phase
     """
-    max_iterations = 50
-    iteration = 0
-
-    while iteration < max_iterations:
-        mid_jd = (start_jd + end_jd) / 2
-        current_angle = get_sun_moon_angle(mid_jd)
-
-        # Handle angle wrapping (e.g., New Moon around 0°/360°)
-        if target_angle == 0:
-            # For new moon, treat angles > 180 as negative
-            if current_angle > 180:
-                current_angle = current_angle - 360
+    def distance_from_target(jd: float) -> float:
+        # Signed distance stays continuous across the New Moon crossing at 0/360
+        return angular_difference(get_sun_moon_angle(jd), target_angle)
 
-        # Calculate error
-        error = current_angle - target_angle
+    exact_jd = brent_root(distance_from_target, start_jd, end_jd, tolerance)
 
-        # Check if we're within tolerance
-        if abs(error) < tolerance:
-            return mid_jd
+    if exact_jd is None:
+        # Phase not reached within the window - fall back to its midpoint
+        return (start_jd + end_jd) / 2
 
-        # Adjust search range
-        if error > 0:
-            end_jd = mid_jd
-        else:
-            start_jd = mid_jd
-
-        iteration += 1
-
-    # Return best estimate if we didn't converge
-    return (start_jd + end_jd) / 2
+    return exact_jd
 
 
 def detect_phase_crossing(prev_angle: float, curr_angle: float, target_angle: float) -> bool:
@@ -165,6 +154,25 @@ def detect_phase_crossing(prev_angle: float, curr_angle: float, target_angle: fl
     return False
 
 
+def find_phase_crossing_days(angles: List[float], target_angle: float) -> List[int]:
+    """
+    Find the days on which a daily Sun-Moon angle series crosses a target angle.
+
+    Applies detect_phase_crossing to each consecutive pair of the series.
+
+    Args:
+        angles: Daily Sun-Moon angles in degrees (0-360)
+        target_angle: Target phase angle (0, 90, 180, 270)
+
+    Returns:
+        Indices of days whose angle crossed the target since the previous day
+    """
+    return [
+        day for day, (prev_angle, curr_angle) in enumerate(zip(angles, angles[1:]), start=1)
+        if detect_phase_crossing(prev_angle, curr_angle, target_angle)
+    ]
+
+
 def find_moon_phases(year: int) -> List[Dict[str, Any]]:
     """
     Find all moon phases for a given year.
@@ -177,59 +185,49 @@ def find_moon_phases(year: int) -> List[Dict[str, Any]]:
     """
     phases = []
 
-    # Scan through year at daily intervals
-    start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
-
-    current_date = start_date
-    prev_angle = get_sun_moon_angle(datetime_to_julian_day(current_date))
-
-    while current_date < end_date:
-        current_date += timedelta(days=1)
-        current_jd = datetime_to_julian_day(current_date)
-        current_angle = get_sun_moon_angle(current_jd)
-
-        # Check for each phase type
-        for phase_name, target_angle in MOON_PHASES.items():
-            if detect_phase_crossing(prev_angle, current_angle, target_angle):
-                # Found a phase crossing, use binary search to find exact time
-                prev_jd = current_jd - 1.0  # Previous day
-                exact_jd = find_exact_phase_time(prev_jd, current_jd, target_angle)
-
-                # Get exact positions at phase time
-                sun_pos = swe.calc_ut(exact_jd, PLANETS['Sun']['id'], SWEPH_FLAGS)[0]
-                moon_pos = swe.calc_ut(exact_jd, PLANETS['Moon']['id'], SWEPH_FLAGS)[0]
-
-                sun_lon = sun_pos[0]
-                moon_lon = moon_pos[0]
-
-                sun_sign, sun_degree = get_zodiac_sign(sun_lon)
-                moon_sign, moon_degree = get_zodiac_sign(moon_lon)
-
-                # Calculate exactness (how close to perfect alignment)
-                angle_diff = abs(get_sun_moon_angle(exact_jd) - target_angle)
-                if target_angle == 0 and angle_diff > 180:
-                    angle_diff = 360 - angle_diff
-
-                phase_data = {
-                    'phase': phase_name,
-                    'date': format_datetime_iso(julian_day_to_datetime(exact_jd)),
-                    'julian_day': round_decimal(exact_jd),
-                    'sun_longitude': round_decimal(sun_lon),
-                    'moon_longitude': round_decimal(moon_lon),
-                    'sun_sign': sun_sign,
-                    'moon_sign': moon_sign,
-                    'sun_degree': round_decimal(sun_degree),
-                    'moon_degree': round_decimal(moon_degree),
-                    'exactness_degrees': round_decimal(angle_diff, 8)
-                }
-
-                phases.append(phase_data)
-
-        prev_angle = current_angle
+    # Scan through year at daily intervals, using the shared daily samples
+    year_table = get_year_longitudes(year)
+    start_jd = year_table['start_jd']
+    sun_lons = year_table['longitudes']['Sun']
+    moon_lons = year_table['longitudes']['Moon']
+    daily_angles = [(moon_lon - sun_lon) % 360 for sun_lon, moon_lon in zip(sun_lons, moon_lons)]
+
+    for phase_name, target_angle in MOON_PHASES.items():
+        # Only days where the target angle was crossed need refining
+        for day in find_phase_crossing_days(daily_angles, target_angle):
+            current_jd = start_jd + day
+
+            # Found a phase crossing, refine to the exact time
+            prev_jd = current_jd - 1.0  # Previous day
+            exact_jd = find_exact_phase_time(prev_jd, current_jd, target_angle)
+
+            # Get exact positions at phase time (already computed by the refiner)
+            sun_lon, _ = calc_planet_position(exact_jd, _SUN_ID)
+            moon_lon, _ = calc_planet_position(exact_jd, _MOON_ID)
+
+            sun_sign, sun_degree = get_zodiac_sign(sun_lon)
+            moon_sign, moon_degree = get_zodiac_sign(moon_lon)
+
+            # Calculate exactness (how close to perfect alignment)
+            angle_diff = abs(angular_difference(moon_lon - sun_lon, target_angle))
+
+            phase_data = {
+                'phase': phase_name,
+                'date': format_datetime_iso(julian_day_to_datetime(exact_jd)),
+                'julian_day': round_decimal(exact_jd),
+                'sun_longitude': round_decimal(sun_lon),
+                'moon_longitude': round_decimal(moon_lon),
+                'sun_sign': sun_sign,
+                'moon_sign': moon_sign,
+                'sun_degree': round_decimal(sun_degree),
+                'moon_degree': round_decimal(moon_degree),
+                'exactness_degrees': round_decimal(angle_diff, 8)
+            }
+
+            phases.append(phase_data)
 
     # Sort phases by date
-    phases.sort(key=lambda x: x['julian_day'])
+    phases.sort(key=itemgetter('julian_day'))
 
     return phases
 
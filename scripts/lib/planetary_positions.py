@@ -3,12 +3,13 @@ Calculate daily planetary positions for all planets.
 """
 
 import swisseph as swe
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict, List, Any
 from lib.config import PLANETS, SWEPH_FLAGS
 from utils.formatters import get_zodiac_sign, format_datetime_iso, format_date_only, round_decimal
 from utils.julian_date import datetime_to_julian_day
 from lib.moon_phases import get_sun_moon_angle, get_moon_phase_name
+from lib.longitude_cache import get_year_longitudes
 
 
 def calculate_planet_position(planet_id: int, jd: float) -> Dict[str, Any]:
@@ -26,11 +27,22 @@ def calculate_planet_position(planet_id: int, jd: float) -> Dict[str, Any]:
     result = swe.calc_ut(jd, planet_id, SWEPH_FLAGS)
 
     # result[0] contains: [longitude, latitude, distance, speed_lon, speed_lat, speed_dist]
-    longitude = result[0][0]
-    latitude = result[0][1]
-    distance = result[0][2]
-    speed = result[0][3]  # Longitudinal speed in degrees/day
+    return format_planet_position(result[0][0], result[0][1], result[0][2], result[0][3])
 
+
+def format_planet_position(longitude: float, latitude: float, distance: float, speed: float) -> Dict[str, Any]:
+    """
+    Build the position record for a planet from its raw ephemeris values.
+
+    Args:
+        longitude: Ecliptic longitude in degrees
+        latitude: Ecliptic latitude in degrees
+        distance: Distance in AU
+        speed: Longitudinal speed in degrees/day
+
+    Returns:
+        Dictionary with planet position data
+    """
     # Get zodiac sign and degree within sign
     sign, degree_in_sign = get_zodiac_sign(longitude)
 
@@ -90,15 +102,34 @@ def generate_month_positions(year: int, month: int) -> Dict[str, Any]:
     first_day = datetime(year, month, 1, tzinfo=timezone.utc)
     days_in_month = (next_month - first_day).days
 
+    # Midnight UTC Julian Days are exactly 1.0 apart, so convert only the first day
+    first_jd = datetime_to_julian_day(first_day)
+
+    # Every planet's midnight position is already in the shared daily table for the year
+    year_table = get_year_longitudes(year)
+    longitudes = year_table['longitudes']
+    latitudes = year_table['latitudes']
+    distances = year_table['distances']
+    speeds = year_table['speeds']
+    sun_lons = longitudes['Sun']
+    moon_lons = longitudes['Moon']
+    first_index = (first_day - datetime(year, 1, 1, tzinfo=timezone.utc)).days
+
     # Generate positions for each day
     positions = []
     for day in range(1, days_in_month + 1):
         date = datetime(year, month, day, tzinfo=timezone.utc)
-        jd = datetime_to_julian_day(date)
-        planet_positions = calculate_daily_positions(date)
+        jd = first_jd + (day - 1)
+        index = first_index + day - 1
+
+        planet_positions = {
+            planet_name: format_planet_position(longitudes[planet_name][index], latitudes[planet_name][index],
+                                                distances[planet_name][index], speeds[planet_name][index])
+            for planet_name in PLANETS
+        }
 
         # Calculate moon phase
-        sun_moon_angle = get_sun_moon_angle(jd)
+        sun_moon_angle = get_sun_moon_angle(jd, sun_lons[index], moon_lons[index])
         moon_phase = get_moon_phase_name(sun_moon_angle)
 
         positions.append({
@@ -135,10 +166,12 @@ def generate_year_positions(year: int, output_dir: str = '../data/daily-position
     """
     import os
     from utils.formatters import save_json
+    from lib.position_store import save_year_positions_binary
 
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
 
+    year_positions = []
     for month in range(1, 13):
         print(f"Generating positions for {year}-{month:02d}...")
         data = generate_month_positions(year, month)
@@ -147,4 +180,10 @@ def generate_year_positions(year: int, output_dir: str = '../data/daily-position
         save_json(data, output_file)
         print(f"  Saved to {output_file}")
 
+        year_positions.extend(data['positions'])
+
+    # Fixed-width binary copy for fast single-day lookups
+    binary_file = save_year_positions_binary(year, year_positions, output_dir)
+    print(f"  Saved binary index to {binary_file}")
+
     print(f"\nCompleted generating positions for {year}!")
@@ -0,0 +1,140 @@
+"""
+Fixed-width binary store for daily planetary positions.
+
+The monthly JSON files remain the published format. Alongside them, one
+binary file per year (`YYYY.bin`) holds the same values in fixed-size
+records indexed by day of year, so a single day can be read with one seek
+instead of parsing a whole month of JSON.
+"""
+
+import os
+import struct
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from lib.config import PLANETS, SIGN_INDEX, ZODIAC_SIGNS
+from utils.formatters import format_date_only
+
+# Moon phase names in record order (matches lib.moon_phases.get_moon_phase_name)
+MOON_PHASE_NAMES = (
+    'new',
+    'waxing_crescent',
+    'first_quarter',
+    'waxing_gibbous',
+    'full',
+    'waning_gibbous',
+    'last_quarter',
+    'waning_crescent'
+)
+
+# Planet order in each record
+PLANET_ORDER = tuple(PLANETS)
+
+# Per day: julian_day, moon phase index, then per planet:
+# longitude, latitude, distance_au, speed, degree_in_sign, sign index, retrograde
+DAY_RECORD = struct.Struct('<dB' + '5dBB' * len(PLANET_ORDER))
+
+
+def encode_day_positions(position: Dict[str, Any]) -> bytes:
+    """
+    Pack one day's position entry into a binary record.
+
+    Args:
+        position: Daily entry as produced by generate_month_positions
+
+    Returns:
+        Packed record bytes
+    """
+    values = [position['julian_day'], MOON_PHASE_NAMES.index(position['moon_phase'])]
+    for planet_name in PLANET_ORDER:
+        planet = position['planets'][planet_name]
+        values.extend((
+            planet['longitude'],
+            planet['latitude'],
+            planet['distance_au'],
+            planet['speed'],
+            planet['degree_in_sign'],
+            SIGN_INDEX[planet['sign']],
+            planet['retrograde']
+        ))
+    return DAY_RECORD.pack(*values)
+
+
+def decode_day_positions(record: bytes, date: datetime) -> Dict[str, Any]:
+    """
+    Unpack a binary record into a daily position entry.
+
+    Args:
+        record: Packed record bytes
+        date: Date the record belongs to
+
+    Returns:
+        Daily entry in the same shape as the monthly JSON files
+    """
+    values = DAY_RECORD.unpack(record)
+
+    planets = {}
+    for i, planet_name in enumerate(PLANET_ORDER):
+        longitude, latitude, distance, speed, degree, sign_index, retrograde = values[2 + i * 7:9 + i * 7]
+        planets[planet_name] = {
+            'longitude': longitude,
+            'latitude': latitude,
+            'distance_au': distance,
+            'speed': speed,
+            'sign': ZODIAC_SIGNS[sign_index],
+            'degree_in_sign': degree,
+            'retrograde': bool(retrograde)
+        }
+
+    return {
+        'date': format_date_only(date),
+        'time': '00:00:00Z',
+        'julian_day': values[0],
+        'moon_phase': MOON_PHASE_NAMES[values[1]],
+        'planets': planets
+    }
+
+
+def save_year_positions_binary(year: int, positions: List[Dict[str, Any]],
+                               output_dir: str = '../data/daily-positions') -> str:
+    """
+    Write a year of daily position entries to a binary file.
+
+    Args:
+        year: Year the positions belong to
+        positions: Daily entries for the whole year, in date order
+        output_dir: Directory to save output file
+
+    Returns:
+        Path of the written file
+    """
+    output_file = os.path.join(output_dir, f"{year}.bin")
+    with open(output_file, 'wb') as f:
+        f.write(b''.join(encode_day_positions(position) for position in positions))
+    return output_file
+
+
+def load_day_positions(date_str: str, data_dir: str = '../data/daily-positions') -> Optional[Dict[str, Any]]:
+    """
+    Read a single day's positions from the yearly binary file.
+
+    Args:
+        date_str: Date in YYYY-MM-DD format
+        data_dir: Directory containing the binary files
+
+    Returns:
+        Daily position entry, or None if no binary data covers the date
+    """
+    date = datetime.strptime(date_str, '%Y-%m-%d')
+    day_index = (date - datetime(date.year, 1, 1)).days
+
+    try:
+        with open(os.path.join(data_dir, f"{date.year}.bin"), 'rb') as f:
+            f.seek(day_index * DAY_RECORD.size)
+            record = f.read(DAY_RECORD.size)
+    except FileNotFoundError:
+        return None
+
+    if len(record) < DAY_RECORD.size:
+        return None
+
+    return decode_day_positions(record, date)
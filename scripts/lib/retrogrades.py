@@ -3,74 +3,61 @@ Calculate planetary retrograde periods.
 """
 
 import swisseph as swe
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Tuple
-from lib.config import PLANETS, SWEPH_FLAGS, RETROGRADE_PLANETS
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+from lib.config import PLANETS, RETROGRADE_PLANETS
 from utils.formatters import get_zodiac_sign, format_datetime_iso, round_decimal
-from utils.julian_date import datetime_to_julian_day, julian_day_to_datetime
+from utils.julian_date import julian_day_to_datetime
+from utils.root_finding import brent_root
+from lib.longitude_cache import calc_planet_position, get_year_longitudes
 
 
-def get_planet_speed(jd: float, planet_name: str) -> Tuple[float, float]:
+def get_planet_speed(jd: float, planet_id: int) -> Tuple[float, float]:
     """
     Get planet longitude and speed at given Julian Day.
 
     Args:
         jd: Julian Day number
-        planet_name: Name of planet
+        planet_id: Swiss Ephemeris planet ID (resolve once via PLANETS)
 
     Returns:
         Tuple of (longitude, speed)
     """
-    planet_id = PLANETS[planet_name]['id']
-    result = swe.calc_ut(jd, planet_id, SWEPH_FLAGS)
-    longitude = result[0][0]
-    speed = result[0][3]  # Longitudinal speed in degrees/day
-    return longitude, speed
+    return calc_planet_position(jd, planet_id)
 
 
 def find_exact_station_time(start_jd: float, end_jd: float, planet_name: str,
-                            tolerance: float = 0.0001) -> float:
+                            tolerance: float = 1e-6, start_speed: Optional[float] = None,
+                            end_speed: Optional[float] = None) -> float:
     """
     Find exact time when planet speed crosses zero (station).
 
+    Uses Brent's method on the longitudinal speed. Speeds already known at
+    the window ends (e.g. from the daily scan) save two ephemeris calls.
+
     Args:
         start_jd: Starting Julian Day
         end_jd: Ending Julian Day
         planet_name: Name of planet
-        tolerance: Acceptable error in speed
+        tolerance: Acceptable error in the time (days)
+        start_speed: Speed at start_jd, if already known
+        end_speed: Speed at end_jd, if already known
 
     Returns:
         Julian Day of exact station
     """
-    max_iterations = 50
-    iteration = 0
-
-    while iteration < max_iterations:
-        mid_jd = (start_jd + end_jd) / 2
-        _, speed = get_planet_speed(mid_jd, planet_name)
-
-        if abs(speed) < tolerance:
-            return mid_jd
+    planet_id = PLANETS[planet_name]['id']
 
-        # Check which direction to search
-        _, start_speed = get_planet_speed(start_jd, planet_name)
-        _, end_speed = get_planet_speed(end_jd, planet_name)
+    def speed_at(jd: float) -> float:
+        return get_planet_speed(jd, planet_id)[1]
 
-        # Use bisection based on sign of speed
-        if speed > 0:
-            if start_speed < 0:
-                end_jd = mid_jd
-            else:
-                start_jd = mid_jd
-        else:
-            if end_speed > 0:
-                start_jd = mid_jd
-            else:
-                end_jd = mid_jd
+    exact_jd = brent_root(speed_at, start_jd, end_jd, tolerance, fa=start_speed, fb=end_speed)
 
-        iteration += 1
+    if exact_jd is None:
+        # Speed keeps its sign within the window - fall back to its midpoint
+        return (start_jd + end_jd) / 2
 
-    return (start_jd + end_jd) / 2
+    return exact_jd
 
 
 def find_retrograde_periods(year: int, planet_names: List[str] = None) -> List[Dict[str, Any]]:
@@ -89,28 +76,30 @@ def find_retrograde_periods(year: int, planet_names: List[str] = None) -> List[D
 
     retrograde_periods = []
 
-    # Scan through year at daily intervals
-    start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    # Scan through year at daily intervals, using the shared daily samples
+    year_table = get_year_longitudes(year)
+    start_jd = year_table['start_jd']
 
     for planet_name in planet_names:
-        current_date = start_date
-        prev_lon, prev_speed = get_planet_speed(datetime_to_julian_day(current_date), planet_name)
+        planet_id = PLANETS[planet_name]['id']
+        daily_lons = year_table['longitudes'][planet_name]
+        daily_speeds = year_table['speeds'][planet_name]
+        prev_lon, prev_speed = daily_lons[0], daily_speeds[0]
 
         station_rx_data = None  # Store station retrograde data
 
-        while current_date < end_date:
-            current_date += timedelta(days=1)
-            current_jd = datetime_to_julian_day(current_date)
-            curr_lon, curr_speed = get_planet_speed(current_jd, planet_name)
+        for day in range(1, year_table['num_days'] + 1):
+            current_jd = start_jd + day
+            curr_lon, curr_speed = daily_lons[day], daily_speeds[day]
 
             # Check for station retrograde (speed crosses 0 from + to -)
             if prev_speed > 0 and curr_speed < 0:
                 # Found station retrograde
                 prev_jd = current_jd - 1.0
-                exact_jd = find_exact_station_time(prev_jd, current_jd, planet_name)
+                exact_jd = find_exact_station_time(prev_jd, current_jd, planet_name,
+                                                   start_speed=prev_speed, end_speed=curr_speed)
 
-                exact_lon, _ = get_planet_speed(exact_jd, planet_name)
+                exact_lon, _ = get_planet_speed(exact_jd, planet_id)
                 sign, degree = get_zodiac_sign(exact_lon)
 
                 station_rx_data = {
@@ -127,9 +116,10 @@ def find_retrograde_periods(year: int, planet_names: List[str] = None) -> List[D
                 if station_rx_data is not None:
                     # Complete the retrograde period
                     prev_jd = current_jd - 1.0
-                    exact_jd = find_exact_station_time(prev_jd, current_jd, planet_name)
+                    exact_jd = find_exact_station_time(prev_jd, current_jd, planet_name,
+                                                       start_speed=prev_speed, end_speed=curr_speed)
 
-                    exact_lon, _ = get_planet_speed(exact_jd, planet_name)
+                    exact_lon, _ = get_planet_speed(exact_jd, planet_id)
                     sign, degree = get_zodiac_sign(exact_lon)
 
                     station_direct_data = {
@@ -4,13 +4,46 @@ Test script to calculate a natal chart.
 """
 
 import swisseph as swe
-from datetime import datetime
-import pytz
-from lib.config import PLANETS, SWEPH_FLAGS, ZODIAC_SIGNS
+from bisect import bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+from lib.config import PLANETS, SIGN_INDEX, SWEPH_FLAGS
 from utils.formatters import get_zodiac_sign, round_decimal
 from utils.julian_date import datetime_to_julian_day
 
 
+@lru_cache(maxsize=4096)
+def _calc_houses(jd: float, latitude: float, longitude: float) -> tuple:
+    """
+    Get Placidus house cusps and angles, memoized on the exact time and place.
+
+    Args:
+        jd: Julian Day in UTC
+        latitude: Geographic latitude in degrees
+        longitude: Geographic longitude in degrees
+
+    Returns:
+        Tuple of (cusps, ascmc) as returned by swe.houses
+    """
+    return swe.houses(jd, latitude, longitude, b'P')  # 'P' = Placidus
+
+
+@lru_cache(maxsize=65536)
+def _calc_planet(jd: float, planet_id: int) -> tuple:
+    """
+    Get a planet's raw ephemeris position, memoized on the exact time.
+
+    Args:
+        jd: Julian Day in UTC
+        planet_id: Swiss Ephemeris planet ID
+
+    Returns:
+        Tuple of (longitude, latitude, distance, speed_lon, speed_lat, speed_dist)
+    """
+    return swe.calc_ut(jd, planet_id, SWEPH_FLAGS)[0]
+
+
 def calculate_ascendant(jd: float, latitude: float, longitude: float) -> dict:
     """
     Calculate Ascendant (Rising Sign) for a given time and location.
@@ -26,7 +59,7 @@ def calculate_ascendant(jd: float, latitude: float, longitude: float) -> dict:
     # Calculate houses using Placidus system (most common)
     # swe.houses returns (cusps, ascmc)
     # ascmc[0] is Ascendant, ascmc[1] is MC
-    houses_result = swe.houses(jd, latitude, longitude, b'P')  # 'P' = Placidus
+    houses_result = _calc_houses(jd, latitude, longitude)
     cusps = houses_result[0]
     ascmc = houses_result[1]
 
@@ -82,16 +115,13 @@ def calculate_natal_chart(birth_datetime: datetime, latitude: float, longitude:
     # Calculate Ascendant and houses
     houses_data = calculate_ascendant(jd, latitude, longitude)
 
-    # Calculate planetary positions
-    planets = {}
-    for planet_name, planet_info in PLANETS.items():
-        planet_id = planet_info['id']
-        result = swe.calc_ut(jd, planet_id, SWEPH_FLAGS)
+    # Calculate planetary positions in one pass over the ephemeris,
+    # then build the records from the raw values
+    raw_positions = [_calc_planet(jd, planet_info['id']) for planet_info in PLANETS.values()]
 
-        longitude = result[0][0]
-        latitude_planet = result[0][1]
-        distance = result[0][2]
-        speed = result[0][3]
+    planets = {}
+    for planet_name, position in zip(PLANETS, raw_positions):
+        longitude, latitude_planet, distance, speed = position[:4]
 
         sign, degree = get_zodiac_sign(longitude)
 
@@ -106,30 +136,17 @@ def calculate_natal_chart(birth_datetime: datetime, latitude: float, longitude:
         }
 
     # Determine which house each planet is in
-    for planet_name, planet_data in planets.items():
-        planet_lon = planet_data['longitude']
-
-        # Find which house the planet is in
-        # A planet is in a house if its longitude is between the cusp of that house
-        # and the cusp of the next house
-        for i, cusp in enumerate(houses_data['house_cusps']):
-            next_i = (i + 1) % 12
-            next_cusp = houses_data['house_cusps'][next_i]
-
-            cusp_lon = cusp['longitude']
-            next_cusp_lon = next_cusp['longitude']
-
-            # Handle zodiac wrap-around (Pisces to Aries)
-            if next_cusp_lon < cusp_lon:
-                # House crosses 0° Aries
-                if planet_lon >= cusp_lon or planet_lon < next_cusp_lon:
-                    planet_data['house'] = cusp['house']
-                    break
-            else:
-                # Normal case
-                if cusp_lon <= planet_lon < next_cusp_lon:
-                    planet_data['house'] = cusp['house']
-                    break
+    # A planet is in a house if its longitude is between the cusp of that house
+    # and the cusp of the next house. Measured from the first cusp, the cusps
+    # increase from 0 to 360, so the wrap-around at 0° Aries disappears and
+    # the house is found by bisecting the cusp offsets.
+    first_cusp_lon = houses_data['house_cusps'][0]['longitude']
+    cusp_offsets = [(cusp['longitude'] - first_cusp_lon) % 360 for cusp in houses_data['house_cusps']]
+
+    for planet_data in planets.values():
+        planet_offset = (planet_data['longitude'] - first_cusp_lon) % 360
+        # Number of cusps at or before the planet = house number (1-12)
+        planet_data['house'] = bisect_right(cusp_offsets, planet_offset)
 
     return {
         'birth_datetime': birth_datetime.isoformat(),
@@ -157,28 +174,21 @@ def find_house_for_sign(house_cusps: list, sign_name: str) -> list:
     """
     houses_with_sign = []
 
-    for i, cusp in enumerate(house_cusps):
-        next_i = (i + 1) % 12
-        next_cusp = house_cusps[next_i]
+    # Start of the 30 degree range of longitudes covered by the sign
+    sign_start = SIGN_INDEX[sign_name] * 30
 
+    # Pair each cusp with the next one, wrapping from house 12 to house 1
+    for cusp, next_cusp in zip(house_cusps, house_cusps[1:] + house_cusps[:1]):
         cusp_lon = cusp['longitude']
-        next_cusp_lon = next_cusp['longitude']
-
-        # Get the range of signs covered by this house
-        sign_index = ZODIAC_SIGNS.index(sign_name)
-        sign_start = sign_index * 30
-        sign_end = sign_start + 30
-
-        # Check if the sign falls within this house
-        if next_cusp_lon < cusp_lon:
-            # House crosses 0° Aries
-            if (sign_start >= cusp_lon or sign_end <= next_cusp_lon or
-                (sign_start < next_cusp_lon and cusp_lon <= sign_end)):
-                houses_with_sign.append(cusp['house'])
-        else:
-            # Normal case - check if sign overlaps with house
-            if (sign_start < next_cusp_lon and sign_end > cusp_lon):
-                houses_with_sign.append(cusp['house'])
+
+        # Measure angles forward from the cusp, so houses crossing 0° Aries
+        # need no special case
+        house_span = (next_cusp['longitude'] - cusp_lon) % 360
+
+        # The sign overlaps the house if it starts inside the house or the
+        # house starts inside the sign
+        if (sign_start - cusp_lon) % 360 < house_span or (cusp_lon - sign_start) % 360 < 30:
+            houses_with_sign.append(cusp['house'])
 
     return houses_with_sign
 
@@ -192,11 +202,10 @@ def main():
     # Timezone: China Standard Time (UTC+8)
 
     # Create datetime in China Standard Time
-    china_tz = pytz.timezone('Asia/Shanghai')
-    birth_local = china_tz.localize(datetime(1988, 12, 16, 21, 30, 0))
+    birth_local = datetime(1988, 12, 16, 21, 30, 0, tzinfo=ZoneInfo('Asia/Shanghai'))
 
     # Convert to UTC for calculations
-    birth_utc = birth_local.astimezone(pytz.UTC)
+    birth_utc = birth_local.astimezone(timezone.utc)
 
     latitude = 31.2304  # Shanghai latitude
     longitude = 121.4737  # Shanghai longitude
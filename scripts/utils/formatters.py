@@ -5,6 +5,13 @@ JSON formatting and data structure utilities.
 import json
 from datetime import datetime
 from typing import Any, Dict
+from lib.config import ZODIAC_SIGNS
+
+# orjson parses several times faster than the stdlib; it is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def get_zodiac_sign(longitude: float) -> tuple[str, float]:
@@ -17,16 +24,24 @@ def get_zodiac_sign(longitude: float) -> tuple[str, float]:
     Returns:
         Tuple of (sign_name, degree_in_sign)
     """
-    from lib.config import ZODIAC_SIGNS
+    # Normalize longitude to 0-360 range, then split into 30 degree signs
+    sign_index, degree_in_sign = divmod(longitude % 360, 30)
 
-    # Normalize longitude to 0-360 range
-    longitude = longitude % 360
+    return ZODIAC_SIGNS[int(sign_index)], degree_in_sign
 
-    # Each sign is 30 degrees
-    sign_index = int(longitude / 30)
-    degree_in_sign = longitude % 30
 
-    return ZODIAC_SIGNS[sign_index], degree_in_sign
+def angular_difference(angle1: float, angle2: float) -> float:
+    """
+    Signed shortest angular distance from angle2 to angle1.
+
+    Args:
+        angle1: First angle in degrees
+        angle2: Second angle in degrees
+
+    Returns:
+        Difference in degrees, wrapped into [-180, 180)
+    """
+    return (angle1 - angle2 + 180) % 360 - 180
 
 
 def format_datetime_iso(dt: datetime) -> str:
@@ -39,7 +54,8 @@ def format_datetime_iso(dt: datetime) -> str:
     Returns:
         ISO 8601 formatted string (e.g., "2025-01-15T14:23:47Z")
     """
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # The C isoformat methods avoid strftime's per-call format parsing
+    return f"{dt.date().isoformat()}T{dt.time().isoformat('seconds')}Z"
 
 
 def format_date_only(dt: datetime) -> str:
@@ -52,7 +68,7 @@ def format_date_only(dt: datetime) -> str:
     Returns:
         Date string (e.g., "2025-01-15")
     """
-    return dt.strftime("%Y-%m-%d")
+    return dt.date().isoformat()
 
 
 def round_decimal(value: float, decimals: int = 6) -> float:
@@ -86,11 +102,18 @@ def load_json(filepath: str) -> Dict[str, Any]:
     """
     Load JSON file into data structure.
 
+    Uses orjson when installed. Saving always goes through the stdlib so
+    float formatting in the committed data files stays stable.
+
     Args:
         filepath: Path to JSON file
 
     Returns:
         Loaded data structure
     """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
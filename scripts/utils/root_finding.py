@@ -0,0 +1,102 @@
+"""
+Root-finding utilities for refining event times.
+"""
+
+import sys
+from typing import Callable, Optional
+
+
+def brent_root(func: Callable[[float], float], a: float, b: float,
+               tolerance: float = 1e-5, max_iterations: int = 50,
+               fa: Optional[float] = None, fb: Optional[float] = None) -> Optional[float]:
+    """
+    Find a root of func within [a, b] using Brent's method.
+
+    Combines bisection with secant and inverse quadratic interpolation steps,
+    so it keeps the guaranteed convergence of bisection while typically
+    needing far fewer function evaluations.
+
+    Args:
+        func: Function of one variable (e.g. Julian Day -> residual)
+        a: Start of bracketing interval
+        b: End of bracketing interval
+        tolerance: Acceptable error in the root (same units as a and b)
+        max_iterations: Maximum number of iterations
+        fa: Precomputed func(a), if already known
+        fb: Precomputed func(b), if already known
+
+    Returns:
+        Root location, or None if func does not change sign over [a, b]
+    """
+    if fa is None:
+        fa = func(a)
+    if fb is None:
+        fb = func(b)
+
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        return None
+
+    c, fc = a, fa
+    d = e = b - a
+
+    for _ in range(max_iterations):
+        # Keep the root bracketed between b and c
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+
+        # Make b the best estimate so far
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2.0 * sys.float_info.epsilon * abs(b) + 0.5 * tolerance
+        m = 0.5 * (c - b)
+
+        if abs(m) <= tol or fb == 0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Attempt interpolation
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                # Accept interpolation
+                e = d
+                d = p / q
+            else:
+                # Interpolation failed, fall back to bisection
+                d = m
+                e = m
+        else:
+            # Bounds decreasing too slowly, use bisection
+            d = m
+            e = m
+
+        a, fa = b, fb
+        if abs(d) > tol:
+            b += d
+        else:
+            b += tol if m > 0 else -tol
+        fb = func(b)
+
+    return b